@@ -3,16 +3,16 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from datetime import datetime, timedelta
 
-from helpers.game_state import get_game, delete_game
+from helpers.game_state import get_game, delete_game, Alignment, Phase
 from helpers.permissions import (
     gm_only, require_game, manage_discord_role,
-    get_gm_role, get_im_role, GM_ROLE, IM_ROLE
+    get_staff_members, GM_ROLE, IM_ROLE
 )
 from helpers.utils import (
     update_game_channel_permissions, archive_game, 
-    add_user_to_thread_safe, format_time_remaining, close_all_pm_threads
+    add_user_to_thread_safe, format_time_remaining, close_pms_if_disabled,
+    gather_limited, add_users_to_threads, create_private_thread_safe, run_in_background
 )
 from helpers.role_actions import assign_mistborn_power
 
@@ -63,77 +63,55 @@ class AdminCog(commands.Cog):
         """Forcibly eliminate a player."""
         game = get_game(interaction.guild_id)
         
-        if player.id not in game.players:
-            await interaction.response.send_message(
+        # Defer first - thread adds and permission edits can exceed the 3s deadline
+        await interaction.response.defer()
+        
+        target = game.players.get(player.id)
+        if target is None:
+            await interaction.followup.send(
                 f"❌ {player.mention} is not in the game.",
                 ephemeral=True
             )
             return
         
-        if not game.players[player.id].is_alive:
-            await interaction.response.send_message(
+        if not target.is_alive:
+            await interaction.followup.send(
                 f"❌ {player.mention} is already dead!",
                 ephemeral=True
             )
             return
         
         # Kill the player
-        game.players[player.id].is_alive = False
-        game.eliminated.append(player.id)
+        pms_were_open = game.pms_open
+        game.eliminate_player(player.id)
+        
+        guild = interaction.guild
+        game_channel = guild.get_channel(game.channels.game_channel_id)
         
         # Add to dead/spec thread
         if game.channels.dead_spec_thread_id:
-            dead_spec_thread = interaction.guild.get_thread(game.channels.dead_spec_thread_id)
+            dead_spec_thread = guild.get_thread(game.channels.dead_spec_thread_id)
             if dead_spec_thread:
                 await add_user_to_thread_safe(dead_spec_thread, player)
         
-        await update_game_channel_permissions(interaction.guild, game)
+        await update_game_channel_permissions(guild, game, game_channel)
         
-        # Check if PMs should be closed
-        if game.roles.pm_enabling_roles and not game.are_pms_available():
-            game_channel = interaction.guild.get_channel(game.channels.game_channel_id)
-            closed_count = await close_all_pm_threads(interaction.guild, game)
-            if closed_count > 0 and game_channel:
-                await game_channel.send(
-                    f"🔒 **PMs have been disabled!** {closed_count} PM thread(s) have been closed."
-                )
+        # Close PM threads only when this death flipped PMs from available to unavailable
+        await close_pms_if_disabled(guild, game, game_channel, pms_were_open)
         
         player_name = game.get_player_display_name(player.id)
         
-        await interaction.response.send_message(
+        await interaction.followup.send(
             f"⚰️ **{player_name}** has been force eliminated by the GM."
         )
         
         # Check win
-        winner = game.check_win_condition()
-        if winner:
-            game_channel = interaction.guild.get_channel(game.channels.game_channel_id)
+        game_over_msg = game.finalize_if_won()
+        if game_over_msg:
             if game_channel:
-                if winner == 'last_standing':
-                    survivors = [p for p in game.players.values() if p.is_alive]
-                    if survivors:
-                        winner_name = game.get_player_display_name(survivors[0].user_id)
-                        await game_channel.send(
-                            f"🎊 **GAME OVER!**\n"
-                            f"**{winner_name}** is the last one standing and wins!\n\n"
-                            f"Archiving game channels..."
-                        )
-                    else:
-                        await game_channel.send(
-                            f"🎊 **GAME OVER!**\n"
-                            f"No one survived!\n\n"
-                            f"Archiving game channels..."
-                        )
-                else:
-                    await game_channel.send(
-                        f"🎊 **GAME OVER!**\n"
-                        f"**{winner.title()} has won!**\n\n"
-                        f"Archiving game channels..."
-                    )
-            
-            game.status = 'ended'
-            await archive_game(interaction.guild, game)
+                await game_channel.send(game_over_msg)
             delete_game(interaction.guild_id)
+            run_in_background(archive_game(guild, game), name=f"archive-{game.guild_id}")
     
     @app_commands.command(name="revive", description="[GM/IM] Revive an eliminated player")
     @app_commands.describe(player="The player to revive")
@@ -143,24 +121,23 @@ class AdminCog(commands.Cog):
         """Revive a dead player."""
         game = get_game(interaction.guild_id)
         
-        if player.id not in game.players:
+        target = game.players.get(player.id)
+        if target is None:
             await interaction.response.send_message(
                 f"❌ {player.mention} is not in the game.",
                 ephemeral=True
             )
             return
         
-        if game.players[player.id].is_alive:
+        if target.is_alive:
             await interaction.response.send_message(
                 f"❌ {player.mention} is already alive!",
                 ephemeral=True
             )
             return
         
-        # Revive
-        game.players[player.id].is_alive = True
-        if player.id in game.eliminated:
-            game.eliminated.remove(player.id)
+        # Revive (reviving a PM-enabling role reopens PMs for new conversations)
+        game.revive_player(player.id)
         
         await update_game_channel_permissions(interaction.guild, game)
         
@@ -179,15 +156,18 @@ class AdminCog(commands.Cog):
         """Start the game - creates threads and locks settings."""
         game = get_game(interaction.guild_id)
         
+        # Defer before any validation so slow guild lookups can't miss the 3s deadline
+        await interaction.response.defer()
+        
         if len(game.players) < 3:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "❌ Need at least 3 players to start the game!",
                 ephemeral=True
             )
             return
         
         if not game.channels.game_channel_id:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "⚠️ No game channel set! Use `/create_game_channel` or `/set_game_channel` first.",
                 ephemeral=True
             )
@@ -196,15 +176,13 @@ class AdminCog(commands.Cog):
         # Check alignments
         unassigned = [p.display_name for p in game.players.values() if not p.alignment]
         if unassigned:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"⚠️ **Players without alignments:** {', '.join(unassigned)}\n"
                 f"Use `/assign_role` or `/randomize_alignments` first!",
                 ephemeral=True
             )
             return
         
-        await interaction.response.defer()
-        
         guild = interaction.guild
         game_channel = guild.get_channel(game.channels.game_channel_id)
         
@@ -212,93 +190,141 @@ class AdminCog(commands.Cog):
             await interaction.followup.send("❌ Game channel not found!")
             return
         
-        gm_role = get_gm_role(guild)
-        im_role = get_im_role(guild)
+        # Snapshot GM/IM members once - role.members walks the whole member cache
+        staff_members = get_staff_members(guild)
         
-        # Create dead/spec thread
         thread_prefix = game.game_tag.lower() if game.game_tag else ""
         dead_spec_name = f"💀-{thread_prefix}-dead-spec" if thread_prefix else "💀-dead-spec"
-        dead_spec_thread = await game_channel.create_thread(
-            name=dead_spec_name,
-            type=discord.ChannelType.private_thread,
-            invitable=False
+        elim_thread_name = f"🔴-{thread_prefix}-elims" if thread_prefix else "🔴-elim-discussion"
+        
+        # Resolve elims once, dropping anyone who has left the server
+        elim_members = []
+        elim_mentions = []
+        for uid, p in game.players.items():
+            if p.alignment is Alignment.ELIMS:
+                member = guild.get_member(uid)
+                if member:
+                    elim_members.append(member)
+                    elim_mentions.append(member.mention)
+        
+        # Players who left the server get no private thread
+        player_members = [
+            (player, member)
+            for user_id, player in game.players.items()
+            if (member := guild.get_member(user_id))
+        ]
+        
+        # Thread specs (existing ID, name): dead/spec, elim discussion, then one per player
+        thread_specs = [(game.channels.dead_spec_thread_id, dead_spec_name)]
+        if elim_members:
+            thread_specs.append((game.channels.elim_discussion_thread_id, elim_thread_name))
+        thread_specs.extend(
+            (player.private_channel_id, f"{thread_prefix}-{member.name}-gm-pm" if thread_prefix else f"{member.name}-gm-pm")
+            for player, member in player_members
+        )
+        
+        # Reuse threads left by an earlier, interrupted start; create the rest concurrently
+        threads = [guild.get_thread(thread_id) if thread_id else None for thread_id, _ in thread_specs]
+        missing = [i for i, thread in enumerate(threads) if thread is None]
+        created = await gather_limited(
+            create_private_thread_safe(game_channel, thread_specs[i][1]) for i in missing
         )
-        game.channels.dead_spec_thread_id = dead_spec_thread.id
+        for i, thread in zip(missing, created):
+            threads[i] = thread
+        
+        dead_spec_thread = threads[0]
+        elim_thread = threads[1] if elim_members else None
+        private_threads = threads[2:] if elim_members else threads[1:]
+        
+        # Record whatever exists so a retry picks up where this attempt stopped
+        if dead_spec_thread:
+            game.channels.dead_spec_thread_id = dead_spec_thread.id
+        if elim_thread:
+            game.channels.elim_discussion_thread_id = elim_thread.id
+        for (player, _), private_thread in zip(player_members, private_threads):
+            if private_thread:
+                player.private_channel_id = private_thread.id
+        
+        failed = sum(1 for thread in threads if thread is None)
+        if failed:
+            await interaction.followup.send(
+                f"❌ Failed to create {failed} thread{'s' if failed != 1 else ''}. "
+                f"Run `/start_game` again to retry - threads already created will be reused."
+            )
+            return
         
-        # Add GM/IM to dead/spec
-        for role in [gm_role, im_role]:
-            if role:
-                for member in role.members:
-                    await add_user_to_thread_safe(dead_spec_thread, member)
+        thread_by_id = {thread.id: thread for thread in private_threads}
         
-        # Add spectators
+        # Collect all membership adds, then run them in one concurrent batch
+        additions = []
+        
+        # Dead/spec: GM/IM and spectators
+        additions.extend((dead_spec_thread, member) for member in staff_members)
         for spectator_id in game.spectators:
             spectator = guild.get_member(spectator_id)
             if spectator:
-                await add_user_to_thread_safe(dead_spec_thread, spectator)
-        
-        await dead_spec_thread.send(
-            f"💀 **Dead/Spectator Thread**\n"
-            f"This thread is for dead players and spectators.\n"
-            f"Players will gain access here when eliminated."
-        )
-        
-        # Create elim discussion thread
-        elim_members = [
-            guild.get_member(uid) 
-            for uid, p in game.players.items() 
-            if p.alignment == 'elims'
+                additions.append((dead_spec_thread, spectator))
+        
+        # Elim discussion: elims and GM/IM
+        if elim_thread:
+            additions.extend((elim_thread, member) for member in elim_members)
+            additions.extend((elim_thread, member) for member in staff_members)
+        
+        # Private threads: the player and GM/IM
+        for (player, member), private_thread in zip(player_members, private_threads):
+            additions.append((private_thread, member))
+            additions.extend((private_thread, staff_member) for staff_member in staff_members)
+        
+        await add_users_to_threads(additions)
+        
+        # Intro messages, sent concurrently once everyone has been added
+        sends = [
+            dead_spec_thread.send(
+                f"💀 **Dead/Spectator Thread**\n"
+                f"This thread is for dead players and spectators.\n"
+                f"Players will gain access here when eliminated."
+            )
         ]
         
-        if elim_members:
-            elim_thread_name = f"🔴-{thread_prefix}-elims" if thread_prefix else "🔴-elim-discussion"
-            elim_thread = await game_channel.create_thread(
-                name=elim_thread_name,
-                type=discord.ChannelType.private_thread,
-                invitable=False
-            )
-            game.channels.elim_discussion_thread_id = elim_thread.id
-            
-            for member in elim_members:
-                if member:
-                    await add_user_to_thread_safe(elim_thread, member)
-            
-            for role in [gm_role, im_role]:
-                if role:
-                    for member in role.members:
-                        await add_user_to_thread_safe(elim_thread, member)
-            
-            await elim_thread.send(
+        if elim_thread:
+            sends.append(elim_thread.send(
                 f"🔴 **Elim Discussion Thread**\n"
                 f"This is your private space to coordinate kills and strategy.\n"
-                f"**Elims:** {', '.join(m.mention for m in elim_members if m)}\n\n"
+                f"**Elims:** {', '.join(elim_mentions)}\n\n"
                 f"Use `!kill [player]` or `!kill none` during night phases to submit your kill."
+            ))
+        
+        # Commands section is the same for every player - build it once
+        vote_cmd = "`!vote [player]`"
+        if game.config.allow_no_elimination:
+            vote_cmd += " or `!vote none`"
+        
+        if game.config.anon_mode:
+            commands_block = (
+                f"\n\n**Commands (use in this thread):**\n"
+                f"• `!say [message]` - Post anonymously\n"
+                f"• {vote_cmd} - Vote during day\n"
+                f"• `!unvote` - Remove your current vote\n"
+                f"• `/player_list` - See living players\n"
+                f"• `/vote_count` - See current votes\n"
+                f"• `/time_remaining` - Check phase timer\n"
+                f"• `/command_list` - See all commands"
+            )
+        else:
+            commands_block = (
+                f"\n\n**Commands:**\n"
+                f"• {vote_cmd} - Vote during day\n"
+                f"• `!unvote` - Remove your current vote\n"
+                f"• `/player_list` - See living players\n"
+                f"• `/vote_count` - See current votes\n"
+                f"• `/time_remaining` - Check phase timer\n"
+                f"• `/command_list` - See all commands"
             )
         
-        # Create private threads for each player
         created_threads = []
-        for user_id, player in game.players.items():
-            member = guild.get_member(user_id)
-            if not member:
-                continue
-            
-            thread_name = f"{thread_prefix}-{member.name}-gm-pm" if thread_prefix else f"{member.name}-gm-pm"
-            private_thread = await game_channel.create_thread(
-                name=thread_name,
-                type=discord.ChannelType.private_thread,
-                invitable=False
-            )
-            
-            player.private_channel_id = private_thread.id
+        for (player, member), private_thread in zip(player_members, private_threads):
             created_threads.append(private_thread.mention)
             
-            await add_user_to_thread_safe(private_thread, member)
-            
-            for role in [gm_role, im_role]:
-                if role:
-                    for gm_member in role.members:
-                        await add_user_to_thread_safe(private_thread, gm_member)
-            
             # Build welcome message
             welcome_parts = [f"Welcome {member.mention}! This is your private thread with the GM/IM."]
             
@@ -312,60 +338,41 @@ class AdminCog(commands.Cog):
             if game.config.anon_mode and player.anon_identity:
                 welcome_parts.append(f"\n\n🎭 **Your Anonymous Identity:** {player.anon_identity}")
             
-            if player.alignment == 'elims' and game.channels.elim_discussion_thread_id:
-                elim_thread = guild.get_thread(game.channels.elim_discussion_thread_id)
-                if elim_thread:
-                    welcome_parts.append(f"\n\n🔴 **{game.config.elim_name} Discussion:** {elim_thread.mention}")
-            
-            # Commands
-            vote_cmd = "`!vote [player]`"
-            if game.config.allow_no_elimination:
-                vote_cmd += " or `!vote none`"
-            
-            if game.config.anon_mode:
-                welcome_parts.append(
-                    f"\n\n**Commands (use in this thread):**\n"
-                    f"• `!say [message]` - Post anonymously\n"
-                    f"• {vote_cmd} - Vote during day\n"
-                    f"• `!unvote` - Remove your current vote\n"
-                    f"• `/player_list` - See living players\n"
-                    f"• `/vote_count` - See current votes\n"
-                    f"• `/time_remaining` - Check phase timer\n"
-                    f"• `/command_list` - See all commands"
-                )
-            else:
-                welcome_parts.append(
-                    f"\n\n**Commands:**\n"
-                    f"• {vote_cmd} - Vote during day\n"
-                    f"• `!unvote` - Remove your current vote\n"
-                    f"• `/player_list` - See living players\n"
-                    f"• `/vote_count` - See current votes\n"
-                    f"• `/time_remaining` - Check phase timer\n"
-                    f"• `/command_list` - See all commands"
-                )
+            if player.alignment is Alignment.ELIMS and elim_thread:
+                welcome_parts.append(f"\n\n🔴 **{game.config.elim_name} Discussion:** {elim_thread.mention}")
             
-            await private_thread.send("".join(welcome_parts))
+            welcome_parts.append(commands_block)
+            sends.append(private_thread.send("".join(welcome_parts)))
+        
+        await gather_limited(sends)
         
         # Update permissions
-        await update_game_channel_permissions(guild, game)
+        await update_game_channel_permissions(guild, game, game_channel)
         
         # Start the game
         game.status = 'active'
-        game.phase = 'Day'
+        game.recount_alive()
+        game.pms_open = game.are_pms_available()
+        game.phase = Phase.DAY
         game.day_number = 1
-        game.phase_end_time = datetime.now() + timedelta(minutes=game.config.day_length_minutes)
+        game.start_phase_timer(game.config.day_length_minutes)
+        gameplay_cog = self.bot.get_cog('GameplayCog')
+        if gameplay_cog:
+            gameplay_cog.schedule_phase_timer(game)
         
-        # Assign Mistborn powers for Day 1
+        # Assign Mistborn powers for Day 1 (notices are sent after the reply below)
+        mistborn_notices = []
         for user_id, player in game.players.items():
             if player.role == 'Mistborn':
                 power = assign_mistborn_power(game, user_id)
                 if power:
-                    private_thread = guild.get_thread(player.private_channel_id)
+                    private_thread = thread_by_id.get(player.private_channel_id)
                     if private_thread:
-                        await private_thread.send(
+                        mistborn_notices.append((
+                            private_thread,
                             f"🎲 **Your Mistborn power for Day 1: {power}**\n"
                             f"Use the `!{power.lower()}` command to use this ability."
-                        )
+                        ))
         
         # Announce
         if game_channel:
@@ -377,7 +384,7 @@ class AdminCog(commands.Cog):
                 f"**Phase:** Day 1\n"
                 f"**Players:** {len(game.players)} ({village_count} Village, {elim_count} Elim{'s' if elim_count != 1 else ''})\n"
                 f"**Mode:** {'Anonymous' if game.config.anon_mode else 'Standard'}\n"
-                f"**Phase ends:** {format_time_remaining(game.phase_end_time)}\n\n"
+                f"**Phase ends:** {format_time_remaining(game)}\n\n"
                 f"Good luck!"
             )
         
@@ -388,6 +395,12 @@ class AdminCog(commands.Cog):
             + f"Created dead/spec thread.\n"
             + f"All threads are under {game_channel.mention}!"
         )
+        
+        if mistborn_notices:
+            run_in_background(
+                gather_limited(thread.send(notice) for thread, notice in mistborn_notices),
+                name=f"mistborn-powers-{game.guild_id}"
+            )
     
     @app_commands.command(name="end_game", description="[GM/IM] End the current game and archive channels")
     @gm_only()
@@ -398,13 +411,31 @@ class AdminCog(commands.Cog):
         
         await interaction.response.defer()
         
-        archived_count, archive_name = await archive_game(interaction.guild, game)
+        # Remove the game right away; archiving runs in the background since every
+        # thread edit is rate-limited and large games can take a while
+        game.status = 'ended'
         delete_game(interaction.guild_id)
         
-        await interaction.followup.send(
-            f"✅ **Game Ended!**\n"
-            f"Archived {archived_count} channel(s) to **{archive_name}**\n"
-            f"All threads are now public and read-only for posterity."
+        status_msg = await interaction.followup.send(
+            "⏳ **Ending game...** Archiving channels.",
+            wait=True
+        )
+        run_in_background(
+            self._finish_archive(interaction.guild, game, status_msg),
+            name=f"archive-{game.guild_id}"
+        )
+    
+    async def _finish_archive(self, guild: discord.Guild, game, status_msg: discord.WebhookMessage):
+        """Archive an ended game's channels and report the result on the end_game reply."""
+        archived_count, archive_name = await archive_game(guild, game)
+        
+        await status_msg.edit(
+            content=(
+                f"✅ **Game Ended!**\n"
+                f"Archived {archived_count} channel(s) to **{archive_name}**\n"
+                f"All threads are now public and read-only for posterity.\n"
+                f"RNG seed (for audits): `{game.rng_seed}`"
+            )
         )
 
 
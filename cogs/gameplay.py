@@ -1,18 +1,20 @@
 """Gameplay commands - voting, kills, phase management."""
 
+import asyncio
+import bisect
+import traceback
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
-from datetime import datetime, timedelta
-import random
+from discord.ext import commands
 
-from helpers.game_state import games, get_game, delete_game
+from helpers.game_state import games, get_game, delete_game, Phase, VOTE_NONE
 from helpers.permissions import is_gm_or_im, gm_only, require_game, get_gm_role, get_im_role
 from helpers.matching import parse_vote_target, parse_kill_target
 from helpers.anonymous import get_or_create_webhook, announce_vote
 from helpers.utils import (
     format_time_remaining, update_game_channel_permissions, 
-    archive_game, add_user_to_thread_safe, close_all_pm_threads
+    archive_game, add_user_to_thread_safe, close_pms_if_disabled, gather_limited,
+    run_in_background, split_message
 )
 from helpers.role_actions import (
     process_night_actions, apply_vote_modifications, 
@@ -20,6 +22,24 @@ from helpers.role_actions import (
     format_tineye_messages, assign_mistborn_power
 )
 from data.identities import ANON_IDENTITIES
+from messages import Announcements, Errors
+
+
+# Phase warning bits for Game.warnings_sent
+WARN_10SEC = 1
+WARN_1MIN = 2
+WARN_2MIN = 4
+WARN_5MIN = 8
+
+# Phase warnings as (seconds before phase end, warnings_sent bit, message), ascending by seconds
+PHASE_WARNINGS = (
+    (10, WARN_10SEC, "⏰ **10 seconds remaining** in this phase!"),
+    (60, WARN_1MIN, "⏰ **1 minute remaining** in this phase!"),
+    (120, WARN_2MIN, "⏰ **2 minutes remaining** in this phase!"),
+    (300, WARN_5MIN, "⏰ **5 minutes remaining** in this phase!")
+)
+WARNING_SECONDS = tuple(seconds for seconds, _, _ in PHASE_WARNINGS)
+WARNING_GRACE_SECONDS = 5  # A warning woken this late is still sent; later than that it is skipped
 
 
 class GameplayCog(commands.Cog):
@@ -27,84 +47,109 @@ class GameplayCog(commands.Cog):
     
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.phase_timer_checker.start()
     
     def cog_unload(self):
-        self.phase_timer_checker.cancel()
+        for game in games.values():
+            if game.phase_task:
+                game.phase_task.cancel()
     
     # ===== PHASE TIMER =====
     
-    @tasks.loop(seconds=10)
-    async def phase_timer_checker(self):
-        """Check all active games for phase transitions and warnings."""
-        for guild_id, game in list(games.items()):
-            if game.status != 'active' or not game.phase_end_time:
-                continue
-            
-            if not game.config.auto_phase_transition:
-                continue
-            
-            now = datetime.now()
-            time_remaining = (game.phase_end_time - now).total_seconds()
-            
-            guild = self.bot.get_guild(guild_id)
-            if not guild:
-                continue
-            
-            game_channel = guild.get_channel(game.channels.game_channel_id)
-            if not game_channel:
-                continue
+    def schedule_phase_timer(self, game) -> None:
+        """(Re)start the task that wakes for this game's phase warnings and phase end."""
+        if game.phase_task and not game.phase_task.done() and game.phase_task is not asyncio.current_task():
+            game.phase_task.cancel()
+        game.phase_task = asyncio.create_task(
+            self._phase_runner(game.guild_id), name=f"phase-timer-{game.guild_id}"
+        )
+    
+    async def _phase_runner(self, guild_id: int) -> None:
+        """Sleep until each warning threshold and the phase end, acting only at those moments."""
+        while True:
+            game = get_game(guild_id)
+            if not game or game.status != 'active':
+                return
             
-            # Send warnings
-            warnings = game.warnings_sent
+            time_remaining = game.seconds_remaining()
+            if time_remaining is None:
+                return
             
-            warning_thresholds = [
-                (295, 305, '5min', "⏰ **5 minutes remaining** in this phase!"),
-                (115, 125, '2min', "⏰ **2 minutes remaining** in this phase!"),
-                (55, 65, '1min', "⏰ **1 minute remaining** in this phase!"),
-                (5, 15, '10sec', "⏰ **10 seconds remaining** in this phase!")
-            ]
+            # Time's up - the phase end schedules a fresh timer for the next phase
+            if time_remaining <= 0:
+                if game.config.auto_phase_transition:
+                    guild = self.bot.get_guild(guild_id)
+                    if guild:
+                        await self._auto_end_phase(guild, game)
+                return
             
-            for min_time, max_time, key, message in warning_thresholds:
-                if min_time <= time_remaining < max_time and key not in warnings:
-                    await self._send_phase_warnings(guild, game, game_channel, message, key)
+            # Warnings from idx on have been reached; only the nearest can still be on time
+            idx = bisect.bisect_left(WARNING_SECONDS, time_remaining)
+            if idx < len(PHASE_WARNINGS):
+                seconds, bit, message = PHASE_WARNINGS[idx]
+                if (
+                    not game.warnings_sent & bit
+                    and time_remaining >= seconds - WARNING_GRACE_SECONDS
+                    and game.config.auto_phase_transition
+                ):
+                    guild = self.bot.get_guild(guild_id)
+                    game_channel = guild.get_channel(game.channels.game_channel_id) if guild else None
+                    if game_channel:
+                        try:
+                            await self._send_phase_warnings(guild, game, game_channel, message, bit)
+                        except Exception as e:
+                            print(f"Error sending phase warning: {e}")
+                # Mark this and every larger threshold as passed
+                for _, passed_bit, _ in PHASE_WARNINGS[idx:]:
+                    game.warnings_sent |= passed_bit
             
-            # Time's up
-            if time_remaining <= 0:
-                await self._auto_end_phase(guild, game)
+            # Sleep until the next warning below the time remaining, or the phase end
+            next_wakeup = WARNING_SECONDS[idx - 1] if idx > 0 else 0
+            await asyncio.sleep(game.seconds_remaining() - next_wakeup)
     
-    async def _send_phase_warnings(self, guild, game, game_channel, message, key):
-        """Send warning messages to relevant channels."""
-        await game_channel.send(message)
+    async def _send_phase_warnings(self, guild, game, game_channel, message, bit):
+        """Send warning messages to relevant channels, all at once."""
+        sends = [game_channel.send(message)]
         
-        if game.phase == 'Night':
+        if game.is_night():
             # Warn elims about pending kill
             night_actions = game.night_actions.get(game.day_number, {})
             if not night_actions.get('elim_kill') and game.channels.elim_discussion_thread_id:
                 elim_thread = guild.get_thread(game.channels.elim_discussion_thread_id)
                 if elim_thread:
-                    await elim_thread.send(
+                    sends.append(elim_thread.send(
                         f"{message}\n⚠️ **Reminder:** You haven't submitted a kill yet! "
                         f"Use `!kill [player]` or `!kill none`"
-                    )
+                    ))
         
         elif game.is_day() and game.config.anon_mode:
-            # Warn players who haven't voted
+            # Warn players who haven't voted - the reminder text is the same for everyone
             day_votes = game.get_day_votes()
-            for user_id, player in game.players.items():
-                if player.is_alive and user_id not in day_votes:
-                    if player.private_channel_id:
-                        private_thread = guild.get_thread(player.private_channel_id)
-                        if private_thread:
-                            await private_thread.send(
-                                f"{message}\n⚠️ **Reminder:** You haven't voted yet! "
-                                f"Use `!vote [player]`{' or `!vote none`' if game.config.allow_no_elimination else ''}"
-                            )
-        
-        game.warnings_sent.add(key)
+            reminder = (
+                f"{message}\n⚠️ **Reminder:** You haven't voted yet! "
+                f"Use `!vote [player]`{' or `!vote none`' if game.config.allow_no_elimination else ''}"
+            )
+            get_thread = guild.get_thread
+            for user_id in game.alive_ids - day_votes.keys():
+                thread_id = game.players[user_id].private_channel_id
+                private_thread = get_thread(thread_id) if thread_id else None
+                if private_thread:
+                    sends.append(private_thread.send(reminder))
+        
+        for result in await gather_limited(sends, return_exceptions=True):
+            if isinstance(result, Exception):
+                print(f"Error sending phase warning: {result}")
+        
+        game.warnings_sent |= bit
     
-    async def _auto_end_phase(self, guild, game):
-        """Automatically end the current phase."""
+    async def _auto_end_phase(self, guild, game) -> bool:
+        """
+        Automatically end the current phase.
+        Returns False without doing anything if another phase end is already in progress.
+        """
+        if game.phase_ending:
+            return False
+        game.phase_ending = True
+        
         game_channel = guild.get_channel(game.channels.game_channel_id)
         dead_spec_thread = None
         if game.channels.dead_spec_thread_id:
@@ -117,34 +162,22 @@ class GameplayCog(commands.Cog):
                 await self._process_night_end(guild, game, game_channel, dead_spec_thread)
         except Exception as e:
             print(f"Error in auto_end_phase: {e}")
-            import traceback
-            traceback.print_exc()
+            traceback.print_exception(e)
             if game_channel:
                 await game_channel.send("❌ Error processing automatic phase end. Please contact a GM.")
+        finally:
+            game.phase_ending = False
+        return True
     
     def _format_final_vote_count(self, game) -> str:
         """Format a complete vote record for end of day with Riot/Soothe effects."""
         # Use the new vote modification function that handles Rioter/Soother
         return format_vote_count_with_modifications(game)
     
-    async def _check_pm_closure(self, guild, game, game_channel) -> None:
-        """Check if PMs should be closed after a death (role-based PM disabling)."""
-        # Only matters if there are PM-enabling roles configured
-        if not game.roles.pm_enabling_roles:
-            return
-        
-        # Check if PMs are still available
-        if not game.are_pms_available():
-            # Close all PM threads
-            closed_count = await close_all_pm_threads(guild, game)
-            if closed_count > 0 and game_channel:
-                await game_channel.send(
-                    f"🔒 **PMs have been disabled!** {closed_count} PM thread(s) have been closed."
-                )
-    
     async def _process_day_end(self, guild, game, game_channel, dead_spec_thread):
         """Process end of day phase - handle elimination."""
         day_votes = game.get_day_votes()
+        pms_were_open = game.pms_open
         
         # Generate vote count before elimination (includes Riot/Soothe effects in totals)
         vote_count_msg = self._format_final_vote_count(game)
@@ -152,15 +185,13 @@ class GameplayCog(commands.Cog):
         elimination_msg = await self._resolve_elimination(guild, game, day_votes, dead_spec_thread)
         
         # Process delayed deaths (Thug delayed_phase dying at night start, delayed_cycle from execution)
-        delayed_death_msgs = await self._process_delayed_deaths(guild, game, dead_spec_thread, 'night', game.day_number)
-        
-        # Build full announcement
-        announcement = f"☀️ **Day {game.day_number} has ended.**\n\n{vote_count_msg}\n\n{elimination_msg}"
-        
-        if delayed_death_msgs:
-            announcement += "\n\n" + "\n\n".join(delayed_death_msgs)
+        delayed_death_msgs = await self._process_delayed_deaths(guild, game, dead_spec_thread, Phase.NIGHT, game.day_number)
         
-        announcement += f"\n\n🌙 **Night {game.day_number} begins...**"
+        # Build full announcement - sections are joined once, separated by blank lines
+        sections = [Announcements.DAY_END.format(day=game.day_number), vote_count_msg, elimination_msg]
+        sections.extend(delayed_death_msgs)
+        sections.append(Announcements.night_start(game.day_number))
+        announcement = "\n\n".join(sections)
         
         # Store vote history for /all_vote_counts
         game.vote_history.append({
@@ -169,64 +200,68 @@ class GameplayCog(commands.Cog):
             'elimination': elimination_msg
         })
         
-        if game_channel:
-            msg = await game_channel.send(announcement)
-            try:
-                await msg.pin()
-            except:
-                pass  # May fail if too many pins
-        
-        # Send action results (Riot/Soothe feedback, Thug survival)
-        await send_action_results(guild, game)
-        
-        await update_game_channel_permissions(guild, game)
+        # Announcement, action results (Riot/Soothe feedback, Thug survival) and permissions are independent
+        await asyncio.gather(
+            self._post_announcement(game_channel, announcement),
+            send_action_results(guild, game),
+            update_game_channel_permissions(guild, game, game_channel)
+        )
         
         # Check if PMs should be closed
-        await self._check_pm_closure(guild, game, game_channel)
+        await close_pms_if_disabled(guild, game, game_channel, pms_were_open)
         
         # Check win
-        winner = game.check_win_condition()
-        if winner:
-            await self._handle_game_over(guild, game, game_channel, winner)
+        game_over_msg = game.finalize_if_won()
+        if game_over_msg:
+            await self._handle_game_over(guild, game, game_channel, game_over_msg)
             return
         
         # Transition to night
-        game.phase = 'Night'
-        game.phase_end_time = datetime.now() + timedelta(minutes=game.config.night_length_minutes)
-        game.warnings_sent = set()
+        game.phase = Phase.NIGHT
+        game.start_phase_timer(game.config.night_length_minutes)
+        self.schedule_phase_timer(game)
+    
+    def _add_to_dead_spec(self, guild, game, dead_spec_thread, user_id: int) -> None:
+        """
+        Invite a dead player to the dead/spec thread without holding up the phase announcement.
+        The invite is tracked on the game so game over can wait for it before archiving.
+        """
+        if not dead_spec_thread:
+            return
+        
+        member = guild.get_member(user_id)
+        if not member:
+            return
+        
+        task = run_in_background(
+            add_user_to_thread_safe(dead_spec_thread, member),
+            name=f"dead-spec-add-{user_id}"
+        )
+        game.pending_thread_adds.add(task)
+        task.add_done_callback(game.pending_thread_adds.discard)
     
-    async def _process_delayed_deaths(self, guild, game, dead_spec_thread, phase_type, day_num):
+    async def _process_delayed_deaths(self, guild, game, dead_spec_thread, phase, day_num):
         """
         Process delayed Thug deaths.
-        phase_type: 'day' (processing at day start) or 'night' (processing at night start)
+        phase: Phase.DAY (processing at day start) or Phase.NIGHT (processing at night start)
         day_num: the day number we're entering
         Returns list of death announcement messages.
         """
         messages = []
-        remaining_deaths = []
-        
-        for player_id, trigger_day, trigger_phase in game.delayed_deaths:
-            if trigger_day == day_num and trigger_phase == phase_type:
-                # Time to die
-                player = game.players.get(player_id)
-                if player and player.is_alive:
-                    player.is_alive = False
-                    game.eliminated.append(player_id)
-                    
-                    player_name = game.get_player_display_name(player_id)
-                    messages.append(
-                        f"💀 **{player_name} has succumbed to their wounds!**\n"
-                        f"They were: **{game.get_player_role_display(player_id)}**"
-                    )
-                    
-                    if dead_spec_thread:
-                        member = guild.get_member(player_id)
-                        if member:
-                            await add_user_to_thread_safe(dead_spec_thread, member)
-            else:
-                remaining_deaths.append((player_id, trigger_day, trigger_phase))
         
-        game.delayed_deaths = remaining_deaths
+        for player_id in game.pop_delayed_deaths(day_num, phase):
+            player = game.players.get(player_id)
+            if player and player.is_alive:
+                game.eliminate_player(player_id)
+                
+                player_name = game.get_player_display_name(player_id)
+                messages.append(
+                    f"💀 **{player_name} has succumbed to their wounds!**\n"
+                    f"They were: **{game.get_player_role_display(player_id)}**"
+                )
+                
+                self._add_to_dead_spec(guild, game, dead_spec_thread, player_id)
+        
         return messages
     
     async def _resolve_elimination(self, guild, game, day_votes, dead_spec_thread):
@@ -241,8 +276,14 @@ class GameplayCog(commands.Cog):
                 return await self._random_elimination(guild, game, dead_spec_thread)
             return "**No votes were cast. No one was eliminated.**"
         
-        max_votes = max(effective_votes.values())
-        top_voted = [tid for tid, count in effective_votes.items() if count == max_votes]
+        # Find the top count and everyone tied at it in one pass
+        max_votes = 0
+        top_voted = []
+        for tid, count in effective_votes.items():
+            if count > max_votes:
+                max_votes, top_voted = count, [tid]
+            elif count == max_votes:
+                top_voted.append(tid)
         
         # Check minimum threshold
         if min_votes > 0 and max_votes < min_votes:
@@ -252,26 +293,19 @@ class GameplayCog(commands.Cog):
             )
         
         # Vote none in top?
-        if 'vote_none' in top_voted:
+        if VOTE_NONE in top_voted:
             return "**No one was eliminated today.** (Vote for no elimination won)"
         
-        # Get player votes only
-        player_votes = [tid for tid in top_voted if tid != 'vote_none']
-        
-        if not player_votes:
-            return "**No one was eliminated today.**"
-        
-        # Random tiebreaker
-        eliminated_id = random.choice(player_votes)
+        # Clear plurality, or random tiebreaker (VOTE_NONE is ruled out above)
+        eliminated_id = top_voted[0] if len(top_voted) == 1 else game.rng.choice(top_voted)
         return await self._eliminate_player(guild, game, eliminated_id, dead_spec_thread, is_execution=True)
     
     async def _random_elimination(self, guild, game, dead_spec_thread):
         """Perform random elimination when no votes cast and min_votes=-1."""
-        alive_players = [uid for uid, p in game.players.items() if p.is_alive]
-        if not alive_players:
+        if not game.alive_ids:
             return "**No votes were cast. No one was eliminated.**"
         
-        eliminated_id = random.choice(alive_players)
+        eliminated_id = game.rng.choice(sorted(game.alive_ids))
         msg = await self._eliminate_player(guild, game, eliminated_id, dead_spec_thread, is_execution=True)
         return msg.replace("has been eliminated!", "has been randomly eliminated!** (No votes were cast)")
     
@@ -295,7 +329,7 @@ class GameplayCog(commands.Cog):
                 )
             elif game.roles.thug_mode == 'delayed_phase':
                 # Executed during Day X -> survive Night X -> die at Day X+1 start
-                game.delayed_deaths.append((user_id, game.day_number + 1, 'day'))
+                game.add_delayed_death(user_id, game.day_number + 1, Phase.DAY)
                 game.add_action_result(
                     user_id,
                     "💪 You were executed! Your Thug ability lets you survive one more phase before death."
@@ -306,7 +340,7 @@ class GameplayCog(commands.Cog):
                 )
             elif game.roles.thug_mode == 'delayed_cycle':
                 # Executed during Day X -> survive Night X, Day X+1 -> die at Night X+1 start
-                game.delayed_deaths.append((user_id, game.day_number + 1, 'night'))
+                game.add_delayed_death(user_id, game.day_number + 1, Phase.NIGHT)
                 game.add_action_result(
                     user_id,
                     "💪 You were executed! Your Thug ability lets you survive one more full cycle before death."
@@ -317,14 +351,9 @@ class GameplayCog(commands.Cog):
                 )
         
         # Normal elimination
-        player.is_alive = False
-        game.eliminated.append(user_id)
+        game.eliminate_player(user_id)
         
-        # Add to dead/spec thread
-        if dead_spec_thread:
-            member = guild.get_member(user_id)
-            if member:
-                await add_user_to_thread_safe(dead_spec_thread, member)
+        self._add_to_dead_spec(guild, game, dead_spec_thread, user_id)
         
         return (
             f"💀 **{player_name} has been eliminated!**\n"
@@ -333,24 +362,23 @@ class GameplayCog(commands.Cog):
     
     async def _process_night_end(self, guild, game, game_channel, dead_spec_thread):
         """Process end of night phase - handle all role actions and kills."""
+        pms_were_open = game.pms_open
         
         # Process all night actions (kills, protections, investigations)
         results = await process_night_actions(guild, game)
         
         # Advance to next day
         game.day_number += 1
-        game.phase = 'Day'
-        game.phase_end_time = datetime.now() + timedelta(minutes=game.config.day_length_minutes)
-        game.warnings_sent = set()
+        game.phase = Phase.DAY
+        game.start_phase_timer(game.config.day_length_minutes)
+        self.schedule_phase_timer(game)
         
         # Build kill/death messages
         death_messages = []
         save_messages = []
         
         for target_id, role, alignment in results['deaths']:
-            player = game.players[target_id]
-            player.is_alive = False
-            game.eliminated.append(target_id)
+            game.eliminate_player(target_id)
             
             player_name = game.get_player_display_name(target_id)
             faction_name = game.get_faction_name(alignment)
@@ -359,41 +387,32 @@ class GameplayCog(commands.Cog):
                 f"They were: **{faction_name} {role or 'Vanilla'}**"
             )
             
-            if dead_spec_thread:
-                member = guild.get_member(target_id)
-                if member:
-                    await add_user_to_thread_safe(dead_spec_thread, member)
+            self._add_to_dead_spec(guild, game, dead_spec_thread, target_id)
         
         for target_id in results['saves']:
             player_name = game.get_player_display_name(target_id)
             save_messages.append(f"🛡️ **{player_name} was attacked but survived!**")
         
         # Process delayed deaths (Thug delayed_cycle or delayed_phase from night attacks)
-        delayed_death_msgs = await self._process_delayed_deaths(guild, game, dead_spec_thread, 'day', game.day_number)
-        
-        # Format output
-        if death_messages:
-            kill_msg = "\n\n".join(death_messages)
-        elif save_messages:
-            kill_msg = "\n".join(save_messages)
-        else:
-            kill_msg = "🛡️ **No one died during the night.**"
-        
-        # Add save messages if there were also deaths
-        if save_messages and death_messages:
-            kill_msg += "\n\n" + "\n".join(save_messages)
-        
-        # Add delayed death messages
-        if delayed_death_msgs:
-            kill_msg += "\n\n" + "\n\n".join(delayed_death_msgs)
+        delayed_death_msgs = await self._process_delayed_deaths(guild, game, dead_spec_thread, Phase.DAY, game.day_number)
+        
+        # Day start announcement sections (joined once, separated by blank lines):
+        # deaths, then saves as one block, then delayed deaths
+        sections = [Announcements.DAY_BEGINS.format(day=game.day_number)]
+        sections.extend(death_messages)
+        if save_messages:
+            sections.append("\n".join(save_messages))
+        if not death_messages and not save_messages:
+            sections.append(Announcements.no_death())
+        sections.extend(delayed_death_msgs)
         
         # Get Tineye messages
         tineye_msg = format_tineye_messages(game)
         
         # Assign Mistborn powers for new day
-        mistborn_msgs = []
-        for player_id, player in game.players.items():
-            if player.is_alive and player.role == 'Mistborn':
+        players = game.players
+        for player_id in game.alive_ids:
+            if players[player_id].role == 'Mistborn':
                 power = assign_mistborn_power(game, player_id)
                 if power:
                     game.add_action_result(
@@ -402,64 +421,50 @@ class GameplayCog(commands.Cog):
                         f"Use the `!{power.lower()}` command to use this ability."
                     )
         
-        # Build day start announcement
-        announcement = f"☀️ **Day {game.day_number} begins!**\n\n{kill_msg}"
-        
         if tineye_msg:
-            announcement += f"\n{tineye_msg}"
-        
-        announcement += "\n\nDiscussion and voting are now open."
-        
-        if game_channel:
-            msg = await game_channel.send(announcement)
-            try:
-                await msg.pin()
-            except:
-                pass  # May fail if too many pins
-        
-        # Send action results to players' GM-PM threads
-        await send_action_results(guild, game)
-        
-        await update_game_channel_permissions(guild, game)
+            sections.append(tineye_msg.lstrip("\n"))
+        sections.append(Announcements.VOTING_OPEN)
+        announcement = "\n\n".join(sections)
+        
+        # Announcement, action results to GM-PM threads and permissions are independent
+        await asyncio.gather(
+            self._post_announcement(game_channel, announcement),
+            send_action_results(guild, game),
+            update_game_channel_permissions(guild, game, game_channel)
+        )
         
         # Check if PMs should be closed
-        await self._check_pm_closure(guild, game, game_channel)
+        await close_pms_if_disabled(guild, game, game_channel, pms_were_open)
         
         # Check win
-        winner = game.check_win_condition()
-        if winner:
-            await self._handle_game_over(guild, game, game_channel, winner)
+        game_over_msg = game.finalize_if_won()
+        if game_over_msg:
+            await self._handle_game_over(guild, game, game_channel, game_over_msg)
     
-    async def _handle_game_over(self, guild, game, game_channel, winner):
-        """Handle game ending."""
-        if game_channel:
-            if winner == 'last_standing':
-                # Find the sole survivor
-                survivors = [p for p in game.players.values() if p.is_alive]
-                if survivors:
-                    survivor = survivors[0]
-                    winner_name = game.get_player_display_name(survivor.user_id)
-                    await game_channel.send(
-                        f"🎊 **GAME OVER!**\n"
-                        f"**{winner_name}** is the last one standing and wins!\n\n"
-                        f"Archiving game channels..."
-                    )
-                else:
-                    await game_channel.send(
-                        f"🎊 **GAME OVER!**\n"
-                        f"No one survived!\n\n"
-                        f"Archiving game channels..."
-                    )
-            else:
-                faction_name = game.get_faction_name(winner)
-                await game_channel.send(
-                    f"🎊 **GAME OVER!**\n"
-                    f"**{faction_name} has won!**\n\n"
-                    f"Archiving game channels..."
-                )
+    async def _post_announcement(self, game_channel, announcement: str) -> None:
+        """Send a phase announcement to the game channel and pin its first message."""
+        if not game_channel:
+            return
         
-        game.status = 'ended'
-        await archive_game(guild, game)
+        # Long announcements (big games, long names) go out in order as several messages
+        messages = [await game_channel.send(chunk) for chunk in split_message(announcement)]
+        if not messages:
+            return
+        try:
+            await messages[0].pin()
+        except:
+            pass  # May fail if too many pins
+    
+    async def _handle_game_over(self, guild, game, game_channel, game_over_msg):
+        """Announce the result of a finished game while archiving it, then delete it."""
+        # Let dead/spec invites land before the threads are locked
+        if game.pending_thread_adds:
+            await asyncio.gather(*game.pending_thread_adds, return_exceptions=True)
+        
+        if game_channel:
+            await asyncio.gather(game_channel.send(game_over_msg), archive_game(guild, game))
+        else:
+            await archive_game(guild, game)
         delete_game(guild.id)
     
     # ===== SLASH COMMANDS =====
@@ -470,11 +475,11 @@ class GameplayCog(commands.Cog):
         """Show time remaining in current phase."""
         game = get_game(interaction.guild_id)
         
-        time_left = format_time_remaining(game.phase_end_time)
+        time_left = format_time_remaining(game)
         auto_status = "🤖 Automatic" if game.config.auto_phase_transition else "👤 Manual"
         
         await interaction.response.send_message(
-            f"⏰ **Current Phase:** {game.phase} {game.day_number}\n"
+            f"⏰ **Current Phase:** {game.get_current_phase_type()} {game.day_number}\n"
             f"**Time Remaining:** {time_left}\n"
             f"**Phase Transitions:** {auto_status}"
         )
@@ -498,24 +503,24 @@ class GameplayCog(commands.Cog):
         # Tally
         tally = game.tally_votes()
         
-        vote_lines = []
+        lines = [
+            f"📊 **Vote Count - Day {game.day_number}**",
+            f"Time remaining: {format_time_remaining(game)}",
+            ""
+        ]
         for target_id, voter_ids in sorted(tally.items(), key=lambda x: len(x[1]), reverse=True):
-            if target_id == 'vote_none':
+            if target_id == VOTE_NONE:
                 target_name = "No One"
             else:
                 target_name = game.get_player_display_name(target_id)
             
-            voter_names = [game.get_player_display_name(vid) for vid in voter_ids]
-            vote_lines.append(f"**{target_name}** ({len(voter_ids)}): {', '.join(voter_names)}")
+            voter_names = game.get_player_display_names(voter_ids)
+            lines.append(f"**{target_name}** ({len(voter_ids)}): {', '.join(voter_names)}")
         
-        alive_count = len([p for p in game.players.values() if p.is_alive])
+        lines.append("")
+        lines.append(f"Total votes: {len(day_votes)}/{len(game.alive_ids)}")
         
-        await interaction.response.send_message(
-            f"📊 **Vote Count - Day {game.day_number}**\n"
-            f"Time remaining: {format_time_remaining(game.phase_end_time)}\n\n"
-            f"{chr(10).join(vote_lines)}\n\n"
-            f"Total votes: {len(day_votes)}/{alive_count}"
-        )
+        await interaction.response.send_message("\n".join(lines))
     
     @app_commands.command(name="all_vote_counts", description="Show all vote results from this game")
     @require_game()
@@ -585,8 +590,7 @@ class GameplayCog(commands.Cog):
         """Clear all votes."""
         game = get_game(interaction.guild_id)
         
-        if game.day_number in game.votes:
-            game.votes[game.day_number] = {}
+        game.clear_day_votes()
         
         await interaction.response.send_message("✅ All votes cleared!")
     
@@ -598,7 +602,9 @@ class GameplayCog(commands.Cog):
         game = get_game(interaction.guild_id)
         
         await interaction.response.defer()
-        await self._auto_end_phase(interaction.guild, game)
+        if not await self._auto_end_phase(interaction.guild, game):
+            await interaction.followup.send(Errors.PHASE_ALREADY_ENDING, ephemeral=True)
+            return
         await interaction.followup.send("✅ Phase manually ended.")
 
 
@@ -4,9 +4,9 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-from helpers.game_state import get_game, Player
+from helpers.game_state import get_game, Player, Alignment
 from helpers.permissions import is_gm_or_im, gm_only, require_game
-from helpers.utils import add_user_to_thread_safe
+from helpers.utils import add_users_to_threads
 
 
 class PlayersCog(commands.Cog):
@@ -48,7 +48,7 @@ class PlayersCog(commands.Cog):
         # Free up anon identity if assigned
         player = game.players.pop(user_id)
         if player.anon_identity:
-            game.available_identities.append(player.anon_identity)
+            game.available_identities[player.anon_identity] = None
         
         await interaction.response.send_message(f"✅ {interaction.user.mention} has left the game.")
     
@@ -63,13 +63,15 @@ class PlayersCog(commands.Cog):
             return
         
         is_gm = is_gm_or_im(interaction)
+        anon_mode = game.config.anon_mode
+        faction_names = {alignment: game.get_faction_name(alignment) for alignment in Alignment}
         
         player_lines = []
         for i, (user_id, player) in enumerate(game.players.items(), 1):
             status = "💀" if not player.is_alive else "✅"
             
             # Display name based on mode
-            if game.config.anon_mode and player.anon_identity:
+            if anon_mode and player.anon_identity:
                 name_display = player.anon_identity
             else:
                 name_display = player.display_name
@@ -79,7 +81,7 @@ class PlayersCog(commands.Cog):
             # Show role info for dead players or GMs
             role_info = ""
             if player.alignment and (not player.is_alive or is_gm):
-                role_info = f" - {game.get_faction_name(player.alignment)}"
+                role_info = f" - {faction_names[player.alignment]}"
                 if player.role:
                     role_info += f" ({player.role})"
             
@@ -110,7 +112,7 @@ class PlayersCog(commands.Cog):
         
         removed = game.players.pop(player.id)
         if removed.anon_identity:
-            game.available_identities.append(removed.anon_identity)
+            game.available_identities[removed.anon_identity] = None
         
         await interaction.response.send_message(f"✅ Removed {player.mention} from the game.")
     
@@ -140,26 +142,15 @@ class PlayersCog(commands.Cog):
         guild = interaction.guild
         member = guild.get_member(user_id)
         
-        game.spectators.append(user_id)
-        
-        # Add to dead/spec thread
-        if game.channels.dead_spec_thread_id:
-            dead_spec_thread = guild.get_thread(game.channels.dead_spec_thread_id)
-            if dead_spec_thread:
-                await add_user_to_thread_safe(dead_spec_thread, member)
-        
-        # Add to all player threads (read-only)
-        for uid, player_data in game.players.items():
-            if player_data.private_channel_id:
-                private_thread = guild.get_thread(player_data.private_channel_id)
-                if private_thread:
-                    await add_user_to_thread_safe(private_thread, member)
-        
-        # Add to elim thread
-        if game.channels.elim_discussion_thread_id:
-            elim_thread = guild.get_thread(game.channels.elim_discussion_thread_id)
-            if elim_thread:
-                await add_user_to_thread_safe(elim_thread, member)
+        game.spectators.add(user_id)
+        
+        # Dead/spec thread, all player threads (read-only) and elim thread, added concurrently
+        thread_ids = [game.channels.dead_spec_thread_id]
+        thread_ids.extend(player_data.private_channel_id for player_data in game.players.values())
+        thread_ids.append(game.channels.elim_discussion_thread_id)
+        
+        threads = (guild.get_thread(thread_id) for thread_id in thread_ids if thread_id)
+        await add_users_to_threads((thread, member) for thread in threads if thread)
         
         await interaction.followup.send(
             f"✅ **You are now spectating the game!**\n"
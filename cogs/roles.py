@@ -1,17 +1,38 @@
 """Role and identity assignment commands."""
 
+import functools
+
 import discord
 from discord import app_commands
 from discord.ext import commands
-import random
 
-from data.identities import ANON_IDENTITIES
+from data.identities import ANON_IDENTITIES, ANON_IDENTITIES_DISPLAY
 from data.roles import (
     ROLE_DEFINITIONS, get_available_roles, get_role_name_normalized,
     get_role_help, GAME_MODES
 )
-from helpers.game_state import get_game
+from helpers.game_state import get_game, Alignment
 from helpers.permissions import gm_only, require_game
+from helpers.utils import close_pms_if_disabled
+
+
+@functools.lru_cache(maxsize=8)
+def _format_role_list(game_mode: str) -> str:
+    """Build the /roles listing for a game mode. Role definitions are static, so it's cached per mode."""
+    lines = [f"**📜 Available Roles ({game_mode.title()} Mode)**\n"]
+    
+    for role_name in get_available_roles(game_mode):
+        role_info = ROLE_DEFINITIONS.get(role_name, {})
+        desc = role_info.get('description', 'No description.')
+        commands_list = role_info.get('commands', [])
+        
+        role_line = f"**{role_name}**"
+        if commands_list:
+            role_line += f" - `{commands_list[0]}`"
+        role_line += f"\n  {desc}"
+        lines.append(role_line)
+    
+    return "\n".join(lines)
 
 
 class RolesCog(commands.Cog):
@@ -26,22 +47,7 @@ class RolesCog(commands.Cog):
         game = get_game(interaction.guild_id)
         game_mode = game.roles.game_mode if game else 'all'
         
-        available = get_available_roles(game_mode)
-        
-        lines = [f"**📜 Available Roles ({game_mode.title()} Mode)**\n"]
-        
-        for role_name in available:
-            role_info = ROLE_DEFINITIONS.get(role_name, {})
-            desc = role_info.get('description', 'No description.')
-            commands_list = role_info.get('commands', [])
-            
-            role_line = f"**{role_name}**"
-            if commands_list:
-                role_line += f" - `{commands_list[0]}`"
-            role_line += f"\n  {desc}"
-            lines.append(role_line)
-        
-        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+        await interaction.response.send_message(_format_role_list(game_mode), ephemeral=True)
     
     @app_commands.command(name="assign_role", description="[GM/IM] Secretly assign alignment and role to a player")
     @app_commands.describe(
@@ -65,7 +71,8 @@ class RolesCog(commands.Cog):
         """Assign alignment and role to a player."""
         game = get_game(interaction.guild_id)
         
-        if player.id not in game.players:
+        target = game.players.get(player.id)
+        if not target:
             await interaction.response.send_message(
                 f"❌ {player.mention} is not in the game!",
                 ephemeral=True
@@ -75,15 +82,20 @@ class RolesCog(commands.Cog):
         # Normalize role name (case-insensitive)
         normalized_role = get_role_name_normalized(role)
         if not normalized_role:
-            available = get_available_roles(game.roles.game_mode)
             await interaction.response.send_message(
                 f"❌ Unknown role '{role}'. Use `/roles` to see available roles.",
                 ephemeral=True
             )
             return
         
-        game.players[player.id].alignment = alignment.value
-        game.players[player.id].role = normalized_role
+        target.alignment = Alignment[alignment.value.upper()]
+        target.role = normalized_role
+        game.recount_alive()
+        
+        # A mid-game role change can add or remove the last PM-enabling role
+        pms_were_open = game.pms_open
+        if game.status == 'active':
+            game.pms_open = game.are_pms_available()
         
         await interaction.response.send_message(
             f"✅ Assigned **{alignment.name} - {normalized_role}** to {player.mention}",
@@ -91,14 +103,17 @@ class RolesCog(commands.Cog):
         )
         
         # Send PM if private thread exists
-        if game.players[player.id].private_channel_id:
-            private_thread = interaction.guild.get_thread(game.players[player.id].private_channel_id)
+        if target.private_channel_id:
+            private_thread = interaction.guild.get_thread(target.private_channel_id)
             if private_thread:
                 await private_thread.send(
                     f"🎭 **Your Role Assignment:**\n"
                     f"**Alignment:** {alignment.name}\n"
                     f"**Role:** {normalized_role}"
                 )
+        
+        game_channel = interaction.guild.get_channel(game.channels.game_channel_id)
+        await close_pms_if_disabled(interaction.guild, game, game_channel, pms_were_open)
     
     @app_commands.command(name="randomize_alignments", description="[GM/IM] Randomly assign village/elim alignments")
     @app_commands.describe(num_elims="Number of elims (default: 1/4 of players, rounded up)")
@@ -120,6 +135,13 @@ class RolesCog(commands.Cog):
         if num_elims is None:
             num_elims = max(1, (total_players + 3) // 4)
         
+        if num_elims < 1:
+            await interaction.response.send_message(
+                "❌ Need at least 1 elim!",
+                ephemeral=True
+            )
+            return
+        
         if num_elims >= total_players:
             await interaction.response.send_message(
                 "❌ Number of elims must be less than total players!",
@@ -129,18 +151,18 @@ class RolesCog(commands.Cog):
         
         # Randomize
         player_ids = list(game.players.keys())
-        random.shuffle(player_ids)
+        game.rng.shuffle(player_ids)
         
         assignments = []
-        for i, user_id in enumerate(player_ids):
-            if i < num_elims:
-                game.players[user_id].alignment = 'elims'
-                game.players[user_id].role = 'Vanilla'
-                assignments.append(f"{game.players[user_id].display_name} → **Elims**")
-            else:
-                game.players[user_id].alignment = 'village'
-                game.players[user_id].role = 'Vanilla'
-                assignments.append(f"{game.players[user_id].display_name} → **Village**")
+        for alignment, label, user_ids in (
+            (Alignment.ELIMS, "Elims", player_ids[:num_elims]),
+            (Alignment.VILLAGE, "Village", player_ids[num_elims:])
+        ):
+            for user_id in user_ids:
+                player = game.players[user_id]
+                player.alignment = alignment
+                player.role = 'Vanilla'
+                assignments.append(f"{player.display_name} → **{label}**")
         
         await interaction.response.send_message(
             f"✅ **Alignments Randomized:**\n"
@@ -170,15 +192,19 @@ class RolesCog(commands.Cog):
             )
             return
         
+        # Return identities from any earlier assignment so everyone is reshuffled
+        for player in game.players.values():
+            if player.anon_identity:
+                game.available_identities[player.anon_identity] = None
+        
         # Shuffle and assign
-        available = game.available_identities.copy()
-        random.shuffle(available)
+        available = list(game.available_identities)
+        game.rng.shuffle(available)
         
         assignments = []
-        for i, (user_id, player) in enumerate(game.players.items()):
-            identity = available[i]
+        for player, identity in zip(game.players.values(), available):
             player.anon_identity = identity
-            game.available_identities.remove(identity)
+            del game.available_identities[identity]
             assignments.append(f"{player.display_name} → **{identity}**")
         
         await interaction.response.send_message(
@@ -204,7 +230,8 @@ class RolesCog(commands.Cog):
             )
             return
         
-        if player.id not in game.players:
+        target = game.players.get(player.id)
+        if not target:
             await interaction.response.send_message(
                 f"❌ {player.mention} is not in the game!",
                 ephemeral=True
@@ -213,7 +240,7 @@ class RolesCog(commands.Cog):
         
         if identity not in ANON_IDENTITIES:
             await interaction.response.send_message(
-                f"❌ Unknown identity: {identity}\n**Available:** {', '.join(ANON_IDENTITIES.keys())}",
+                f"❌ Unknown identity: {identity}\n**Available:** {ANON_IDENTITIES_DISPLAY}",
                 ephemeral=True
             )
             return
@@ -226,13 +253,13 @@ class RolesCog(commands.Cog):
             return
         
         # Free old identity
-        old_identity = game.players[player.id].anon_identity
+        old_identity = target.anon_identity
         if old_identity:
-            game.available_identities.append(old_identity)
+            game.available_identities[old_identity] = None
         
         # Assign new
-        game.players[player.id].anon_identity = identity
-        game.available_identities.remove(identity)
+        target.anon_identity = identity
+        del game.available_identities[identity]
         
         await interaction.response.send_message(
             f"✅ Assigned **{identity}** to {player.mention}",
@@ -8,6 +8,57 @@ from helpers.game_state import games, get_game, create_game, Game, Player
 from helpers.permissions import is_gm_or_im, gm_only, require_game, get_gm_role, get_im_role
 
 
+# Flavor name -> channel name: spaces become hyphens, quotes are dropped
+CHANNEL_SLUG_TABLE = str.maketrans({' ': '-', "'": None, '"': None})
+
+# /config_game settings that take one of a fixed set of values, offered as slash-command choices:
+# (parameter and attribute name, Game section holding it, allowed values, label)
+CHOICE_SETTINGS = (
+    ('win_condition', 'config', ('parity', 'overparity', 'last_man_standing'), "Win condition"),
+    ('game_mode', 'roles', ('all', 'tyrian'), "Game mode"),
+    ('seeker_mode', 'roles', ('role_only', 'alignment_only', 'both'), "Seeker mode"),
+    ('thug_mode', 'roles', ('survive', 'delayed_phase', 'delayed_cycle'), "Thug mode"),
+    ('smoker_phase', 'roles', ('day', 'night', 'both'), "Smoker phase"),
+    ('tineye_phase', 'roles', ('day', 'night', 'both'), "Tineye phase"),
+)
+
+# /config_game on/off settings, all on GameConfig: (parameter and attribute name, label, (on text, off text))
+TOGGLE_SETTINGS = (
+    ('anon_mode', "Anonymous mode", ('Enabled', 'Disabled')),
+    ('secret_votes', "Secret votes", ('Enabled', 'Disabled')),
+    ('auto_phase_transition', "Auto phase transitions", ('Enabled', 'Disabled')),
+    ('allow_no_elimination', "Allow no elimination", ('Enabled', 'Disabled')),
+    ('pms_enabled', "Player PMs", ('Enabled', 'Disabled')),
+    ('gms_see_pms', "GMs see PMs", ('Yes', 'No')),
+)
+
+
+def _value_choices(values: tuple[str, ...]) -> list[app_commands.Choice[str]]:
+    """Slash-command choices for setting values, labelled like 'Last Man Standing'."""
+    return [app_commands.Choice(name=value.replace('_', ' ').title(), value=value) for value in values]
+
+
+def _format_duration(minutes: int) -> str:
+    """Phase length for display, in hours when it's a whole number of them."""
+    if minutes >= 60 and minutes % 60 == 0:
+        return f"{minutes // 60} hours"
+    return f"{minutes} minutes"
+
+
+def _format_min_votes(min_votes: int) -> str:
+    """Display text for the min_votes_to_eliminate setting."""
+    if min_votes == 0:
+        return "Plurality (highest count wins)"
+    if min_votes == -1:
+        return "Force RNG if no votes"
+    return str(min_votes)
+
+
+def _format_coinshot_ammo(ammo: int) -> str:
+    """Display text for the coinshot_ammo setting."""
+    return "Unlimited" if ammo == 0 else f"{ammo} kill(s)"
+
+
 class SetupCog(commands.Cog):
     """Commands for setting up and configuring games."""
     
@@ -105,7 +156,7 @@ class SetupCog(commands.Cog):
         
         # Generate channel name
         if game.game_tag and game.flavor_name:
-            clean_flavor = game.flavor_name.lower().replace(' ', '-').replace("'", '').replace('"', '')
+            clean_flavor = game.flavor_name.lower().translate(CHANNEL_SLUG_TABLE)
             channel_name = f"{game.game_tag.lower()}-{clean_flavor}"
         elif game.game_tag:
             channel_name = game.game_tag.lower()
@@ -170,7 +221,8 @@ class SetupCog(commands.Cog):
         night_unit=[
             app_commands.Choice(name="Minutes", value="minutes"),
             app_commands.Choice(name="Hours", value="hours")
-        ]
+        ],
+        **{name: _value_choices(allowed) for name, _, allowed, _ in CHOICE_SETTINGS}
     )
     @gm_only()
     @require_game()
@@ -181,7 +233,7 @@ class SetupCog(commands.Cog):
         day_unit: app_commands.Choice[str] = None,
         night_length: int = None,
         night_unit: app_commands.Choice[str] = None,
-        win_condition: str = None,
+        win_condition: app_commands.Choice[str] = None,
         anon_mode: bool = None,
         secret_votes: bool = None,
         auto_phase_transition: bool = None,
@@ -191,12 +243,12 @@ class SetupCog(commands.Cog):
         gms_see_pms: bool = None,
         village_name: str = None,
         elim_name: str = None,
-        game_mode: str = None,
-        seeker_mode: str = None,
-        thug_mode: str = None,
+        game_mode: app_commands.Choice[str] = None,
+        seeker_mode: app_commands.Choice[str] = None,
+        thug_mode: app_commands.Choice[str] = None,
         coinshot_ammo: int = None,
-        smoker_phase: str = None,
-        tineye_phase: str = None
+        smoker_phase: app_commands.Choice[str] = None,
+        tineye_phase: app_commands.Choice[str] = None
     ):
         """Configure game settings."""
         game = get_game(interaction.guild_id)
@@ -205,6 +257,10 @@ class SetupCog(commands.Cog):
         if game.status != 'setup':
             if auto_phase_transition is not None:
                 game.config.auto_phase_transition = auto_phase_transition
+                # The phase timer stops at a deadline passed while manual - restart it so it can fire
+                gameplay_cog = self.bot.get_cog('GameplayCog')
+                if auto_phase_transition and game.status == 'active' and gameplay_cog:
+                    gameplay_cog.schedule_phase_timer(game)
                 await interaction.response.send_message(
                     f"✅ Automatic phase transitions: {'Enabled' if auto_phase_transition else 'Disabled'}"
                 )
@@ -216,88 +272,57 @@ class SetupCog(commands.Cog):
                 )
                 return
         
+        choice_values = {
+            'win_condition': win_condition, 'game_mode': game_mode, 'seeker_mode': seeker_mode,
+            'thug_mode': thug_mode, 'smoker_phase': smoker_phase, 'tineye_phase': tineye_phase
+        }
+        toggle_values = {
+            'anon_mode': anon_mode, 'secret_votes': secret_votes,
+            'auto_phase_transition': auto_phase_transition, 'allow_no_elimination': allow_no_elimination,
+            'pms_enabled': pms_enabled, 'gms_see_pms': gms_see_pms
+        }
+        
+        # Validate everything first so one bad value doesn't leave the rest half-applied
+        error = None
+        if day_length is not None and day_unit is None:
+            error = "❌ You must specify day_unit (minutes or hours) when setting day_length!"
+        elif night_length is not None and night_unit is None:
+            error = "❌ You must specify night_unit (minutes or hours) when setting night_length!"
+        elif min_votes_to_eliminate is not None and min_votes_to_eliminate < -1:
+            error = "❌ min_votes_to_eliminate must be -1 or greater!"
+        elif coinshot_ammo is not None and coinshot_ammo < 0:
+            error = "❌ Coinshot ammo must be 0 (unlimited) or a positive number"
+        
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
+            return
+        
         changes = []
         
-        # Day length
         if day_length is not None:
-            if day_unit is None:
-                await interaction.response.send_message(
-                    "❌ You must specify day_unit (minutes or hours) when setting day_length!",
-                    ephemeral=True
-                )
-                return
-            
-            if day_unit.value == "hours":
-                game.config.day_length_minutes = day_length * 60
-                changes.append(f"Day length: {day_length} hours")
-            else:
-                game.config.day_length_minutes = day_length
-                changes.append(f"Day length: {day_length} minutes")
+            game.config.day_length_minutes = day_length * 60 if day_unit.value == "hours" else day_length
+            changes.append(f"Day length: {_format_duration(game.config.day_length_minutes)}")
         
-        # Night length
         if night_length is not None:
-            if night_unit is None:
-                await interaction.response.send_message(
-                    "❌ You must specify night_unit (minutes or hours) when setting night_length!",
-                    ephemeral=True
-                )
-                return
-            
-            if night_unit.value == "hours":
-                game.config.night_length_minutes = night_length * 60
-                changes.append(f"Night length: {night_length} hours")
-            else:
-                game.config.night_length_minutes = night_length
-                changes.append(f"Night length: {night_length} minutes")
-        
-        if win_condition is not None:
-            if win_condition.lower() not in ['parity', 'overparity', 'last_man_standing']:
-                await interaction.response.send_message(
-                    "❌ Win condition must be 'parity', 'overparity', or 'last_man_standing'",
-                    ephemeral=True
-                )
-                return
-            game.config.win_condition = win_condition.lower()
-            changes.append(f"Win condition: {win_condition}")
-        
-        if anon_mode is not None:
-            game.config.anon_mode = anon_mode
-            changes.append(f"Anonymous mode: {'Enabled' if anon_mode else 'Disabled'}")
-        
-        if secret_votes is not None:
-            game.config.secret_votes = secret_votes
-            changes.append(f"Secret votes: {'Enabled' if secret_votes else 'Disabled'}")
-        
-        if auto_phase_transition is not None:
-            game.config.auto_phase_transition = auto_phase_transition
-            changes.append(f"Auto phase transitions: {'Enabled' if auto_phase_transition else 'Disabled'}")
-        
-        if allow_no_elimination is not None:
-            game.config.allow_no_elimination = allow_no_elimination
-            changes.append(f"Allow no elimination: {'Enabled' if allow_no_elimination else 'Disabled'}")
+            game.config.night_length_minutes = night_length * 60 if night_unit.value == "hours" else night_length
+            changes.append(f"Night length: {_format_duration(game.config.night_length_minutes)}")
+        
+        # Discord only offers the listed choices, so these need no validation
+        for name, section, _, label in CHOICE_SETTINGS:
+            choice = choice_values[name]
+            if choice is not None:
+                setattr(getattr(game, section), name, choice.value)
+                changes.append(f"{label}: {choice.value}")
+        
+        for name, label, (on_text, off_text) in TOGGLE_SETTINGS:
+            value = toggle_values[name]
+            if value is not None:
+                setattr(game.config, name, value)
+                changes.append(f"{label}: {on_text if value else off_text}")
         
         if min_votes_to_eliminate is not None:
-            if min_votes_to_eliminate < -1:
-                await interaction.response.send_message(
-                    "❌ min_votes_to_eliminate must be -1 or greater!",
-                    ephemeral=True
-                )
-                return
             game.config.min_votes_to_eliminate = min_votes_to_eliminate
-            if min_votes_to_eliminate == 0:
-                changes.append("Minimum votes: Plurality (highest count wins)")
-            elif min_votes_to_eliminate == -1:
-                changes.append("Minimum votes: Force RNG if no votes")
-            else:
-                changes.append(f"Minimum votes: {min_votes_to_eliminate}")
-        
-        if pms_enabled is not None:
-            game.config.pms_enabled = pms_enabled
-            changes.append(f"Player PMs: {'Enabled' if pms_enabled else 'Disabled'}")
-        
-        if gms_see_pms is not None:
-            game.config.gms_see_pms = gms_see_pms
-            changes.append(f"GMs see PMs: {'Yes' if gms_see_pms else 'No'}")
+            changes.append(f"Minimum votes: {_format_min_votes(min_votes_to_eliminate)}")
         
         if village_name is not None:
             game.config.village_name = village_name
@@ -307,100 +332,29 @@ class SetupCog(commands.Cog):
             game.config.elim_name = elim_name
             changes.append(f"Eliminator faction name: {elim_name}")
         
-        if game_mode is not None:
-            if game_mode.lower() not in ['all', 'tyrian']:
-                await interaction.response.send_message(
-                    "❌ Game mode must be 'all' or 'tyrian'",
-                    ephemeral=True
-                )
-                return
-            game.roles.game_mode = game_mode.lower()
-            changes.append(f"Game mode: {game_mode}")
-        
-        if seeker_mode is not None:
-            if seeker_mode.lower() not in ['role_only', 'alignment_only', 'both']:
-                await interaction.response.send_message(
-                    "❌ Seeker mode must be 'role_only', 'alignment_only', or 'both'",
-                    ephemeral=True
-                )
-                return
-            game.roles.seeker_mode = seeker_mode.lower()
-            changes.append(f"Seeker mode: {seeker_mode}")
-        
-        if thug_mode is not None:
-            if thug_mode.lower() not in ['survive', 'delayed_phase', 'delayed_cycle']:
-                await interaction.response.send_message(
-                    "❌ Thug mode must be 'survive', 'delayed_phase', or 'delayed_cycle'",
-                    ephemeral=True
-                )
-                return
-            game.roles.thug_mode = thug_mode.lower()
-            changes.append(f"Thug mode: {thug_mode}")
-        
         if coinshot_ammo is not None:
-            if coinshot_ammo < 0:
-                await interaction.response.send_message(
-                    "❌ Coinshot ammo must be 0 (unlimited) or a positive number",
-                    ephemeral=True
-                )
-                return
             game.roles.coinshot_ammo = coinshot_ammo
-            if coinshot_ammo == 0:
-                changes.append("Coinshot ammo: Unlimited")
-            else:
-                changes.append(f"Coinshot ammo: {coinshot_ammo} kill(s)")
-        
-        if smoker_phase is not None:
-            if smoker_phase.lower() not in ['day', 'night', 'both']:
-                await interaction.response.send_message(
-                    "❌ Smoker phase must be 'day', 'night', or 'both'",
-                    ephemeral=True
-                )
-                return
-            game.roles.smoker_phase = smoker_phase.lower()
-            changes.append(f"Smoker phase: {smoker_phase}")
-        
-        if tineye_phase is not None:
-            if tineye_phase.lower() not in ['day', 'night', 'both']:
-                await interaction.response.send_message(
-                    "❌ Tineye phase must be 'day', 'night', or 'both'",
-                    ephemeral=True
-                )
-                return
-            game.roles.tineye_phase = tineye_phase.lower()
-            changes.append(f"Tineye phase: {tineye_phase}")
+            changes.append(f"Coinshot ammo: {_format_coinshot_ammo(coinshot_ammo)}")
         
         if not changes:
             # Show current settings
-            day_display = f"{game.config.day_length_minutes // 60} hours" if game.config.day_length_minutes >= 60 else f"{game.config.day_length_minutes} minutes"
-            night_display = f"{game.config.night_length_minutes // 60} hours" if game.config.night_length_minutes >= 60 else f"{game.config.night_length_minutes} minutes"
-            
-            if game.config.min_votes_to_eliminate == 0:
-                min_votes_display = "Plurality (highest count wins)"
-            elif game.config.min_votes_to_eliminate == -1:
-                min_votes_display = "Force RNG if no votes"
-            else:
-                min_votes_display = str(game.config.min_votes_to_eliminate)
-            
-            coinshot_display = "Unlimited" if game.roles.coinshot_ammo == 0 else f"{game.roles.coinshot_ammo} kill(s)"
-            
             await interaction.response.send_message(
                 f"**⚙️ Current Game Settings:**\n"
                 f"• Game Tag: {game.game_tag or 'Not set'}\n"
                 f"• Flavor: {game.flavor_name or 'Not set'}\n"
                 f"• Game Mode: {game.roles.game_mode}\n"
-                f"• Day length: {day_display}\n"
-                f"• Night length: {night_display}\n"
+                f"• Day length: {_format_duration(game.config.day_length_minutes)}\n"
+                f"• Night length: {_format_duration(game.config.night_length_minutes)}\n"
                 f"• Win condition: {game.config.win_condition}\n"
                 f"• Anonymous mode: {'Enabled' if game.config.anon_mode else 'Disabled'}\n"
                 f"• Auto phase transitions: {'Enabled' if game.config.auto_phase_transition else 'Disabled'}\n"
                 f"• Allow no elimination: {'Enabled' if game.config.allow_no_elimination else 'Disabled'}\n"
-                f"• Minimum votes: {min_votes_display}\n"
+                f"• Minimum votes: {_format_min_votes(game.config.min_votes_to_eliminate)}\n"
                 f"• Player PMs: {'Enabled' if game.config.pms_enabled else 'Disabled'}\n"
                 f"• GMs see PMs: {'Yes' if game.config.gms_see_pms else 'No'}\n"
                 f"• Seeker mode: {game.roles.seeker_mode}\n"
                 f"• Thug mode: {game.roles.thug_mode}\n"
-                f"• Coinshot ammo: {coinshot_display}\n"
+                f"• Coinshot ammo: {_format_coinshot_ammo(game.roles.coinshot_ammo)}\n"
                 f"• Smoker phase: {game.roles.smoker_phase}\n"
                 f"• Tineye phase: {game.roles.tineye_phase}\n"
                 f"• Game channel: {'Set' if game.channels.game_channel_id else 'Not set'}"
@@ -121,4 +121,7 @@ ANON_IDENTITIES = {
         'color': 0x7f00ff,
         'avatar_url': 'https://uploads.17thshard.com/monthly_2022_01/61d39f9112198_VioletAxolotl(Budgie).thumb.png.471d08a513541eb1a32fe842387fd880.png'
     }
-}
\ No newline at end of file
+}
+
+# Comma-separated identity names for "available identities" messages
+ANON_IDENTITIES_DISPLAY = ", ".join(ANON_IDENTITIES)
@@ -3,21 +3,15 @@ Role definitions and game modes for SEBOT.
 Based on Brandon Sanderson's Mistborn magic system.
 """
 
+from types import MappingProxyType
+
+# Single-power Allomancer roles - also the pool a Mistborn draws from
+ALLOMANTIC_POWERS = ('Coinshot', 'Lurcher', 'Rioter', 'Soother', 'Smoker', 'Seeker', 'Tineye', 'Thug')
+
 # Game modes determine which roles are available
 GAME_MODES = {
     'all': None,  # None means all roles are available
-    'tyrian': [
-        'Vanilla',
-        'Coinshot',
-        'Lurcher', 
-        'Rioter',
-        'Soother',
-        'Smoker',
-        'Seeker',
-        'Tineye',
-        'Thug',
-        'Mistborn'
-    ]
+    'tyrian': ['Vanilla', *ALLOMANTIC_POWERS, 'Mistborn']
 }
 
 # Comprehensive role definitions
@@ -202,10 +196,13 @@ ROLE_DEFINITIONS = {
             "• Your power changes each day"
         ),
         'commands': [],
-        'powers_pool': ['Coinshot', 'Lurcher', 'Rioter', 'Soother', 'Smoker', 'Seeker', 'Tineye', 'Thug']
+        'powers_pool': ALLOMANTIC_POWERS
     }
 }
 
+# Role definitions are shared by every game - expose each one read-only
+ROLE_DEFINITIONS = {name: MappingProxyType(info) for name, info in ROLE_DEFINITIONS.items()}
+
 # Seeker reveal options (GM configurable)
 SEEKER_MODES = {
     'role_only': 'Reveals only the target\'s role',
@@ -232,45 +229,60 @@ RESOLUTION_ORDER = {
     'cancel_vote': 11
 }
 
-# Map action types to roles that can use them
-ACTION_TO_ROLES = {
-    'kill': ['Coinshot'],
-    'protect': ['Lurcher'],
-    'redirect_vote': ['Rioter'],
-    'cancel_vote': ['Soother'],
-    'investigate': ['Seeker'],
-    'anonymous_message': ['Tineye'],
+def _build_action_to_roles() -> dict[str, list[str]]:
+    """Group roles with a submitted day/night action by their action type."""
+    action_to_roles = {}
+    for name, info in ROLE_DEFINITIONS.items():
+        if info['action_phase'] in ('day', 'night'):
+            action_to_roles.setdefault(info['action_type'], []).append(name)
+    return action_to_roles
+
+
+# Map action types to roles that can use them (passive and special roles excluded)
+ACTION_TO_ROLES = _build_action_to_roles()
+
+
+# Game mode -> roles it allows, built once (unknown modes fall back to 'all')
+AVAILABLE_ROLES_BY_MODE = {
+    mode: list(roles if roles is not None else ROLE_DEFINITIONS)
+    for mode, roles in GAME_MODES.items()
 }
 
 
 def get_available_roles(game_mode: str) -> list[str]:
-    """Get list of roles available for a game mode."""
-    if game_mode == 'all' or game_mode not in GAME_MODES:
-        return list(ROLE_DEFINITIONS.keys())
-    return GAME_MODES[game_mode]
+    """Get list of roles available for a game mode. The list is shared - don't mutate it."""
+    return AVAILABLE_ROLES_BY_MODE.get(game_mode, AVAILABLE_ROLES_BY_MODE['all'])
 
 
-def get_role_info(role_name: str) -> dict | None:
+# Lowercased role name -> properly-cased name, for case-insensitive lookups
+ROLE_NAMES_BY_LOWER = {name.lower(): name for name in ROLE_DEFINITIONS}
+
+# Game mode -> lowercased names of the roles it allows
+ROLE_NAMES_LOWER_BY_MODE = {
+    mode: frozenset(name.lower() for name in roles)
+    for mode, roles in AVAILABLE_ROLES_BY_MODE.items()
+}
+
+
+def get_role_info(role_name: str) -> MappingProxyType | None:
     """Get role definition by name (case-insensitive)."""
-    for name, info in ROLE_DEFINITIONS.items():
-        if name.lower() == role_name.lower():
-            return info
-    return None
+    # Stored roles and power names are already canonical - skip lowercasing for those
+    info = ROLE_DEFINITIONS.get(role_name)
+    if info is not None:
+        return info
+    name = ROLE_NAMES_BY_LOWER.get(role_name.lower())
+    return ROLE_DEFINITIONS[name] if name else None
 
 
 def get_role_name_normalized(role_name: str) -> str | None:
     """Get properly-cased role name (case-insensitive lookup)."""
-    for name in ROLE_DEFINITIONS.keys():
-        if name.lower() == role_name.lower():
-            return name
-    return None
+    return ROLE_NAMES_BY_LOWER.get(role_name.lower())
 
 
 def is_valid_role(role_name: str, game_mode: str) -> bool:
     """Check if a role is valid for the given game mode (case-insensitive)."""
-    available = get_available_roles(game_mode)
-    role_lower = role_name.lower()
-    return any(r.lower() == role_lower for r in available)
+    allowed = ROLE_NAMES_LOWER_BY_MODE.get(game_mode, ROLE_NAMES_LOWER_BY_MODE['all'])
+    return role_name.lower() in allowed
 
 
 def get_role_help(role_name: str) -> str | None:
@@ -2,7 +2,7 @@
 Elim (Mafia) action handlers for !kill command.
 """
 
-from helpers.game_state import get_game
+from helpers.game_state import get_game, Alignment, KILL_NONE
 from helpers.matching import parse_kill_target
 from messages import Errors, Success, Usage
 
@@ -35,7 +35,7 @@ async def handle_kill(message):
         await message.channel.send(Errors.DEAD_PLAYER)
         return
     
-    if player.alignment != 'elims':
+    if player.alignment is not Alignment.ELIMS:
         await message.channel.send("❌ You are not an elim!")
         return
     
@@ -64,7 +64,7 @@ async def handle_kill(message):
     
     await message.add_reaction("✅")
     
-    if result.target_id == 'kill_none':
+    if result.target_id == KILL_NONE:
         await message.channel.send(Success.kill_none())
     else:
         await message.channel.send(Success.kill_submitted(result.target_display))
\ No newline at end of file
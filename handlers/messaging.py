@@ -104,8 +104,8 @@ async def handle_pm(message):
         await message.channel.send("❌ Use !pm in your private GM-PM thread!")
         return
     
-    # Check if PMs are available
-    if not game.are_pms_available():
+    # Check if PMs are available (cached; kept current as PM-enabling roles die or revive)
+    if not game.pms_open:
         await message.channel.send(Errors.PMS_DISABLED)
         return
     
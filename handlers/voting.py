@@ -68,10 +68,7 @@ async def handle_vote(message):
         return
     
     # Record vote
-    if game.day_number not in game.votes:
-        game.votes[game.day_number] = {}
-    
-    game.votes[game.day_number][voter_id] = result.target_id
+    game.cast_vote(voter_id, result.target_id)
     
     await message.add_reaction("✅")
     
@@ -120,15 +117,11 @@ async def handle_unvote(message):
         await message.channel.send("❌ In anonymous mode, use !unvote in your private GM-PM thread!")
         return
     
-    # Check for existing vote
-    day_votes = game.get_day_votes()
-    if voter_id not in day_votes:
+    # Remove vote (if there is one)
+    if not game.remove_vote(voter_id):
         await message.channel.send(Errors.NO_VOTE_TO_REMOVE)
         return
     
-    # Remove vote
-    del game.votes[game.day_number][voter_id]
-    
     await message.add_reaction("✅")
     
     # Announce unvote (or not, depending on mode and location)
@@ -1,15 +1,20 @@
 """Helper modules for SEBOT."""
 
-from helpers.game_state import Game, Player, games, get_game, create_game, delete_game
+from helpers.game_state import (
+    Game, Player, Alignment, Phase, VOTE_NONE, KILL_NONE, games, get_game, create_game, delete_game
+)
 from helpers.permissions import (
     is_gm_or_im, gm_only, require_game,
-    get_gm_role, get_im_role, manage_discord_role
+    get_role_by_name, get_gm_role, get_im_role, get_staff_members, manage_discord_role,
+    RoleQueue, role_queue
 )
 from helpers.matching import find_player_by_name, parse_vote_target, parse_kill_target, MatchResult
 from helpers.anonymous import get_or_create_webhook, post_anon_message, announce_vote
 from helpers.utils import (
     format_time_remaining, update_game_channel_permissions, archive_game,
-    add_user_to_thread_safe, close_all_pm_threads, create_pm_thread
+    add_user_to_thread_safe, close_all_pm_threads, close_pms_if_disabled, create_pm_thread,
+    gather_limited, add_users_to_threads, create_private_thread, create_private_thread_safe,
+    run_in_background, split_message
 )
 from helpers.role_actions import (
     process_night_actions, apply_vote_modifications, format_vote_count_with_modifications,
@@ -18,12 +23,14 @@ from helpers.role_actions import (
 )
 
 __all__ = [
-    'Game', 'Player', 'games', 'get_game', 'create_game', 'delete_game',
-    'is_gm_or_im', 'gm_only', 'require_game', 'get_gm_role', 'get_im_role', 'manage_discord_role',
+    'Game', 'Player', 'Alignment', 'Phase', 'VOTE_NONE', 'KILL_NONE', 'games', 'get_game', 'create_game', 'delete_game',
+    'is_gm_or_im', 'gm_only', 'require_game', 'get_role_by_name', 'get_gm_role', 'get_im_role', 'get_staff_members', 'manage_discord_role', 'RoleQueue', 'role_queue',
     'find_player_by_name', 'parse_vote_target', 'parse_kill_target', 'MatchResult',
     'get_or_create_webhook', 'post_anon_message', 'announce_vote',
     'format_time_remaining', 'update_game_channel_permissions', 'archive_game',
-    'add_user_to_thread_safe', 'close_all_pm_threads', 'create_pm_thread',
+    'add_user_to_thread_safe', 'close_all_pm_threads', 'close_pms_if_disabled', 'create_pm_thread',
+    'gather_limited', 'add_users_to_threads', 'create_private_thread', 'create_private_thread_safe', 'run_in_background',
+    'split_message',
     'process_night_actions', 'apply_vote_modifications', 'format_vote_count_with_modifications',
     'send_action_results', 'format_tineye_messages', 'assign_mistborn_power',
     'get_current_mistborn_power', 'can_use_role_action'
@@ -1,14 +1,40 @@
 """Game state management and data structures."""
 
+import asyncio
+import random
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from enum import IntEnum
 from typing import Optional
 from data.identities import ANON_IDENTITIES
+from messages import Announcements
 
 
 # Global games storage (indexed by guild_id)
 games: dict[int, 'Game'] = {}
 
+# Non-player targets for votes and kills; always compare against these constants
+VOTE_NONE = 'vote_none'
+KILL_NONE = 'kill_none'
+
+
+class Alignment(IntEnum):
+    """Player faction. Starts at 1 so an assigned alignment is always truthy."""
+    VILLAGE = 1
+    ELIMS = 2
+
+
+class Phase(IntEnum):
+    """Phase type within a day cycle."""
+    DAY = 1
+    NIGHT = 2
+    
+    @property
+    def label(self) -> str:
+        """Display name: 'Day' or 'Night'."""
+        return self.name.title()
+
 
 @dataclass
 class Player:
@@ -18,7 +44,7 @@ class Player:
     display_name: str
     anon_identity: Optional[str] = None
     private_channel_id: Optional[int] = None
-    alignment: Optional[str] = None  # 'village' or 'elims'
+    alignment: Optional[Alignment] = None
     role: Optional[str] = None
     is_alive: bool = True
     character_name: Optional[str] = None
@@ -60,6 +86,7 @@ class Channels:
     dead_spec_thread_id: Optional[int] = None
     elim_discussion_thread_id: Optional[int] = None
     pm_threads: dict[frozenset, int] = field(default_factory=dict)
+    permissions_key: Optional[tuple] = None  # (channel_id, overwrite target IDs) last applied
 
 
 @dataclass
@@ -75,14 +102,30 @@ class Game:
     # People
     gm_ids: list[int] = field(default_factory=list)
     players: dict[int, Player] = field(default_factory=dict)
-    spectators: list[int] = field(default_factory=list)
+    spectators: set[int] = field(default_factory=set)  # Checked on every message in main.on_message
     
     # Game state
     status: str = 'setup'  # 'setup', 'active', 'ended'
-    phase: str = 'Day 0'   # 'Day' or 'Night'
+    phase: Phase = Phase.DAY  # Day 0 until the game starts
     day_number: int = 0
-    phase_end_time: Optional[datetime] = None
-    warnings_sent: set = field(default_factory=set)
+    phase_end_time: Optional[datetime] = None  # Wall clock (UTC), for display only
+    phase_end_monotonic: Optional[float] = None  # time.monotonic() deadline used by the timer
+    phase_task: Optional[asyncio.Task] = field(default=None, repr=False)  # Sleeps until the next warning/phase end
+    warnings_sent: int = 0  # Bitmask of phase warnings already sent this phase
+    phase_ending: bool = False  # Set while a phase end is processing, so timer and /end_phase can't both run it
+    pending_thread_adds: set[asyncio.Task] = field(default_factory=set, repr=False)  # Dead/spec invites in flight
+    pms_open: bool = True  # PM availability, re-checked only when a PM-enabling role dies or is revived
+    
+    # Per-game randomness: every random game outcome draws from rng, so a game can be
+    # replayed from rng_seed when auditing tiebreaks and random eliminations
+    rng_seed: int = field(default_factory=lambda: random.SystemRandom().getrandbits(32))
+    rng: random.Random = field(init=False, repr=False)
+    
+    # Cached living IDs and counts per faction - set by recount_alive() at game start, then kept
+    # in sync by eliminate_player()/revive_player(), the only places is_alive should change
+    alive_ids: set[int] = field(default_factory=set)
+    village_alive: int = 0
+    elim_alive: int = 0
     
     # Game metadata
     game_tag: Optional[str] = None
@@ -90,7 +133,10 @@ class Game:
     
     # Voting
     votes: dict[int, dict[int, int | str]] = field(default_factory=dict)
-    eliminated: list[int] = field(default_factory=list)
+    # Inverse of votes, kept in sync by cast_vote()/remove_vote()/clear_day_votes():
+    # {day_number: {target_id: ordered set of voter_ids}}
+    vote_groups: dict[int, dict[int | str, dict[int, None]]] = field(default_factory=dict)
+    eliminated: dict[int, None] = field(default_factory=dict)  # Ordered set of eliminated player IDs
     vote_history: list[dict] = field(default_factory=list)  # [{day, result_text, eliminated_id, ...}]
     
     # Night Actions - {day_number: {action_type: [(actor_id, target_id, extra_data)]}}
@@ -103,7 +149,7 @@ class Game:
     smoker_targets: dict[int, Optional[int]] = field(default_factory=dict)
     smoker_active: dict[int, bool] = field(default_factory=dict)
     thug_used: set[int] = field(default_factory=set)
-    delayed_deaths: list[tuple[int, int, str]] = field(default_factory=list)
+    delayed_deaths: dict[tuple[int, Phase], list[int]] = field(default_factory=dict)  # {(day, phase entered): [player_ids]}
     lurcher_last_targets: dict[int, int] = field(default_factory=dict)
     mistborn_powers_used: dict[int, list[str]] = field(default_factory=dict)
     mistborn_current_power: dict[int, Optional[str]] = field(default_factory=dict)
@@ -114,7 +160,11 @@ class Game:
     action_results: dict[int, list[str]] = field(default_factory=dict)
     
     # Anonymous mode
-    available_identities: list[str] = field(default_factory=lambda: list(ANON_IDENTITIES.keys()))
+    # Ordered set of unassigned identities (ordered so a seeded shuffle of it is reproducible)
+    available_identities: dict[str, None] = field(default_factory=lambda: dict.fromkeys(ANON_IDENTITIES))
+    
+    def __post_init__(self):
+        self.rng = random.Random(self.rng_seed)
     
     # ===== HELPER METHODS =====
     
@@ -128,13 +178,28 @@ class Game:
             return player.anon_identity
         return player.display_name
     
-    def get_faction_name(self, alignment: str) -> str:
+    def get_player_display_names(self, user_ids) -> list[str]:
+        """Get display names for many players at once (same rules as get_player_display_name)."""
+        players = self.players
+        anon = self.config.anon_mode
+        names = []
+        for user_id in user_ids:
+            player = players.get(user_id)
+            if not player:
+                names.append("Unknown")
+            elif anon and player.anon_identity:
+                names.append(player.anon_identity)
+            else:
+                names.append(player.display_name)
+        return names
+    
+    def get_faction_name(self, alignment: Optional[Alignment]) -> str:
         """Get the display name for a faction (village/elims)."""
-        if alignment == 'village':
+        if alignment is Alignment.VILLAGE:
             return self.config.village_name
-        elif alignment == 'elims':
+        elif alignment is Alignment.ELIMS:
             return self.config.elim_name
-        return alignment.title() if alignment else "Unknown"
+        return "Unknown"
     
     def get_player_role_display(self, user_id: int) -> str:
         """Get 'FactionName RoleName' for a player (e.g., 'Village Tineye' or 'Spiked Lurcher')."""
@@ -148,15 +213,15 @@ class Game:
     
     def get_current_phase_type(self) -> str:
         """Get current phase type: 'Day' or 'Night'."""
-        return 'Day' if 'Day' in self.phase else 'Night'
+        return self.phase.label
     
     def is_day(self) -> bool:
         """Check if it's currently day phase."""
-        return 'Day' in self.phase
+        return self.phase is Phase.DAY
     
     def is_night(self) -> bool:
         """Check if it's currently night phase."""
-        return 'Night' in self.phase
+        return self.phase is Phase.NIGHT
     
     def is_allowed_phase(self, allowed: str) -> bool:
         """Check if current phase matches allowed setting."""
@@ -164,55 +229,172 @@ class Game:
             return True
         return allowed.lower() == self.get_current_phase_type().lower()
     
+    def start_phase_timer(self, minutes: int) -> None:
+        """Set the phase deadline and clear warnings sent for the previous phase."""
+        self.phase_end_time = datetime.now(timezone.utc) + timedelta(minutes=minutes)
+        self.phase_end_monotonic = time.monotonic() + minutes * 60
+        self.warnings_sent = 0
+    
+    def seconds_remaining(self) -> Optional[float]:
+        """Seconds until the phase deadline (negative once passed), or None if no timer is set."""
+        if self.phase_end_monotonic is None:
+            return None
+        return self.phase_end_monotonic - time.monotonic()
+    
     def get_alive_players(self) -> list[Player]:
         """Get all living players."""
         return [p for p in self.players.values() if p.is_alive]
     
     def get_alive_count(self) -> tuple[int, int]:
-        """Get count of alive village and elim players."""
-        alive = self.get_alive_players()
-        village = sum(1 for p in alive if p.alignment == 'village')
-        elims = sum(1 for p in alive if p.alignment == 'elims')
-        return village, elims
+        """Get count of alive village and elim players (cached; valid once recount_alive() has run)."""
+        return self.village_alive, self.elim_alive
     
-    def check_win_condition(self) -> Optional[str]:
-        """Check if either side has won. Returns 'village', 'elims', 'last_standing', or None."""
+    def recount_alive(self) -> None:
+        """Rebuild the cached alive IDs and counts from player state (after alignments are assigned)."""
+        alive = self.get_alive_players()
+        self.alive_ids = {p.user_id for p in alive}
+        self.village_alive = sum(1 for p in alive if p.alignment is Alignment.VILLAGE)
+        self.elim_alive = sum(1 for p in alive if p.alignment is Alignment.ELIMS)
+    
+    def _adjust_alive_count(self, alignment: Optional[Alignment], delta: int) -> None:
+        """Apply a +1/-1 change to the cached count for a faction."""
+        if alignment is Alignment.VILLAGE:
+            self.village_alive += delta
+        elif alignment is Alignment.ELIMS:
+            self.elim_alive += delta
+    
+    def eliminate_player(self, user_id: int) -> Player:
+        """
+        Mark a player dead, updating the eliminated record, alive counts and PM availability.
+        Returns the player.
+        """
+        player = self.players[user_id]
+        if player.is_alive:
+            player.is_alive = False
+            self.alive_ids.discard(user_id)
+            self.eliminated[user_id] = None
+            self._adjust_alive_count(player.alignment, -1)
+            if self.pms_open and player.role in self.roles.pm_enabling_roles:
+                self.pms_open = self.are_pms_available()
+        return player
+    
+    def revive_player(self, user_id: int) -> Player:
+        """
+        Bring a dead player back, updating the eliminated record, alive counts and PM availability.
+        Returns the player.
+        """
+        player = self.players[user_id]
+        if not player.is_alive:
+            player.is_alive = True
+            self.alive_ids.add(user_id)
+            self.eliminated.pop(user_id, None)
+            self._adjust_alive_count(player.alignment, 1)
+            if not self.pms_open and player.role in self.roles.pm_enabling_roles:
+                self.pms_open = self.are_pms_available()
+        return player
+    
+    def check_win_condition(self) -> Optional[Alignment | str]:
+        """Check if either side has won. Returns the winning Alignment, 'last_standing', or None."""
+        winner, _ = self.check_win_with_survivors()
+        return winner
+    
+    def check_win_with_survivors(self) -> tuple[Optional[Alignment | str], list[Player]]:
+        """
+        Check the win condition from the cached alive state.
+        Returns (winner, survivors) - winner as in check_win_condition.
+        """
+        survivors = [self.players[uid] for uid in self.alive_ids]
         village_count, elim_count = self.get_alive_count()
-        alive_players = self.get_alive_players()
         
         # Last man standing - only one player left
         if self.config.win_condition == 'last_man_standing':
-            if len(alive_players) == 1:
-                return 'last_standing'
-            return None
+            if len(survivors) == 1:
+                return 'last_standing', survivors
+            return None, survivors
         
         # Village wins if all elims dead
         if elim_count == 0:
-            return 'village'
+            return Alignment.VILLAGE, survivors
         
         # Elims win at parity or overparity
         if self.config.win_condition == 'parity':
             if elim_count >= village_count:
-                return 'elims'
+                return Alignment.ELIMS, survivors
         else:  # overparity
             if elim_count > village_count:
-                return 'elims'
+                return Alignment.ELIMS, survivors
+        
+        return None, survivors
+    
+    def finalize_if_won(self) -> Optional[str]:
+        """
+        End the game if a win condition is met.
+        Marks the game 'ended' and returns the GAME OVER announcement, or None if play continues.
+        """
+        winner, survivors = self.check_win_with_survivors()
+        if not winner:
+            return None
+        
+        self.status = 'ended'
         
-        return None
+        if winner == 'last_standing':
+            if survivors:
+                winner_name = self.get_player_display_name(survivors[0].user_id)
+                result = f"**{winner_name}** is the last one standing and wins!"
+            else:
+                result = "No one survived!"
+        else:
+            result = f"**{self.get_faction_name(winner)} has won!**"
+        
+        return Announcements.GAME_OVER.format(result=result)
     
     def get_day_votes(self) -> dict[int, int | str]:
         """Get votes for current day."""
         return self.votes.get(self.day_number, {})
     
+    def cast_vote(self, voter_id: int, target_id: int | str) -> None:
+        """Record (or change) a vote for the current day."""
+        day_votes = self.votes.setdefault(self.day_number, {})
+        groups = self.vote_groups.setdefault(self.day_number, {})
+        
+        previous = day_votes.get(voter_id)
+        if previous is not None:
+            self._drop_from_vote_group(groups, previous, voter_id)
+        
+        day_votes[voter_id] = target_id
+        groups.setdefault(target_id, {})[voter_id] = None
+    
+    def remove_vote(self, voter_id: int) -> bool:
+        """Remove a voter's vote for the current day. Returns True if there was one."""
+        day_votes = self.votes.get(self.day_number, {})
+        if voter_id not in day_votes:
+            return False
+        
+        target_id = day_votes.pop(voter_id)
+        self._drop_from_vote_group(self.vote_groups.get(self.day_number, {}), target_id, voter_id)
+        return True
+    
+    def clear_day_votes(self) -> None:
+        """Clear all votes for the current day."""
+        if self.day_number in self.votes:
+            self.votes[self.day_number] = {}
+            self.vote_groups[self.day_number] = {}
+    
+    @staticmethod
+    def _drop_from_vote_group(groups: dict, target_id: int | str, voter_id: int) -> None:
+        """Remove a voter from a target's group, dropping the group once empty."""
+        voters = groups.get(target_id)
+        if voters is not None:
+            voters.pop(voter_id, None)
+            if not voters:
+                del groups[target_id]
+    
     def tally_votes(self) -> dict[int | str, list[int]]:
         """Tally votes for current day. Returns {target_id: [voter_ids]}."""
-        day_votes = self.get_day_votes()
-        tally = {}
-        for voter_id, target_id in day_votes.items():
-            if target_id not in tally:
-                tally[target_id] = []
-            tally[target_id].append(voter_id)
-        return tally
+        return {
+            target_id: list(voters)
+            for target_id, voters in self.vote_groups.get(self.day_number, {}).items()
+        }
     
     def get_pm_thread_key(self, player1_id: int, player2_id: int) -> frozenset:
         """Get the key for a PM thread between two players."""
@@ -305,6 +487,17 @@ class Game:
             self.action_results[player_id] = []
         self.action_results[player_id].append(message)
     
+    def add_delayed_death(self, player_id: int, day_number: int, phase: Phase):
+        """Schedule a player to die when the given day's phase begins."""
+        key = (day_number, phase)
+        if key not in self.delayed_deaths:
+            self.delayed_deaths[key] = []
+        self.delayed_deaths[key].append(player_id)
+    
+    def pop_delayed_deaths(self, day_number: int, phase: Phase) -> list[int]:
+        """Remove and return the players due to die as the given day's phase begins."""
+        return self.delayed_deaths.pop((day_number, phase), [])
+    
     def clear_action_results(self):
         """Clear all action results after they've been sent."""
         self.action_results = {}
@@ -332,8 +525,11 @@ def create_game(guild_id: int, creator_id: int) -> Game:
 
 
 def delete_game(guild_id: int) -> bool:
-    """Delete a game. Returns True if game existed."""
+    """Delete a game (cancelling its phase timer). Returns True if game existed."""
     if guild_id in games:
-        del games[guild_id]
+        game = games.pop(guild_id)
+        # The timer itself may be the caller (auto phase end -> game over); let it finish
+        if game.phase_task and game.phase_task is not asyncio.current_task():
+            game.phase_task.cancel()
         return True
     return False
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Player name matching utilities for voting and kill targeting."""
 
 from typing import Optional
-from helpers.game_state import Game
+from helpers.game_state import Game, VOTE_NONE, KILL_NONE
 
 
 class MatchResult:
@@ -136,7 +136,7 @@ def parse_vote_target(game: Game, target_str: str) -> MatchResult:
     Handles special 'none' voting and player matching.
     
     Returns MatchResult with target_id being either:
-    - 'vote_none' for no elimination vote
+    - VOTE_NONE for no elimination vote
     - player user_id for player vote
     """
     target_name = target_str.strip().lower()
@@ -150,7 +150,7 @@ def parse_vote_target(game: Game, target_str: str) -> MatchResult:
             )
         return MatchResult(
             success=True,
-            target_id='vote_none',
+            target_id=VOTE_NONE,
             target_display="No One"
         )
     
@@ -163,7 +163,7 @@ def parse_kill_target(game: Game, target_str: str) -> MatchResult:
     Handles special 'none' kill and player matching.
     
     Returns MatchResult with target_id being either:
-    - 'kill_none' for no kill
+    - KILL_NONE for no kill
     - player user_id for player kill
     """
     target_name = target_str.strip().lower()
@@ -172,7 +172,7 @@ def parse_kill_target(game: Game, target_str: str) -> MatchResult:
     if target_name in ['none', 'no one', 'no kill']:
         return MatchResult(
             success=True,
-            target_id='kill_none',
+            target_id=KILL_NONE,
             target_display="No One"
         )
     
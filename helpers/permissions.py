@@ -1,5 +1,6 @@
 """Permission checks and decorators for command authorization."""
 
+import asyncio
 import discord
 from discord import app_commands
 from functools import wraps
@@ -10,22 +11,105 @@ from helpers.game_state import get_game
 # Role name constants
 GM_ROLE = "GM"
 IM_ROLE = "IM"
+STAFF_ROLES = frozenset({GM_ROLE, IM_ROLE})
 
 
 def is_gm_or_im(interaction: discord.Interaction) -> bool:
     """Check if user has GM or IM role."""
-    user_roles = [role.name for role in interaction.user.roles]
-    return GM_ROLE in user_roles or IM_ROLE in user_roles
+    return any(role.name in STAFF_ROLES for role in interaction.user.roles)
+
+
+# {(guild_id, role_name): role_id} - lets repeat lookups use guild.get_role instead of scanning
+_role_ids: dict[tuple[int, str], int] = {}
+
+
+def get_role_by_name(guild: discord.Guild, name: str) -> Optional[discord.Role]:
+    """
+    Get a guild role by name. The ID is remembered, and re-checked against the
+    role's current name, so a renamed or deleted role falls back to a fresh scan.
+    """
+    key = (guild.id, name)
+    role_id = _role_ids.get(key)
+    if role_id is not None:
+        role = guild.get_role(role_id)
+        if role and role.name == name:
+            return role
+    
+    role = discord.utils.get(guild.roles, name=name)
+    if role:
+        _role_ids[key] = role.id
+    else:
+        _role_ids.pop(key, None)
+    return role
 
 
 def get_gm_role(guild: discord.Guild) -> Optional[discord.Role]:
     """Get the GM role for a guild."""
-    return discord.utils.get(guild.roles, name=GM_ROLE)
+    return get_role_by_name(guild, GM_ROLE)
 
 
 def get_im_role(guild: discord.Guild) -> Optional[discord.Role]:
     """Get the IM role for a guild."""
-    return discord.utils.get(guild.roles, name=IM_ROLE)
+    return get_role_by_name(guild, IM_ROLE)
+
+
+def get_staff_members(guild: discord.Guild) -> list[discord.Member]:
+    """Get all members with the GM or IM role, deduplicated (members holding both appear once)."""
+    staff = {}
+    for role in [get_gm_role(guild), get_im_role(guild)]:
+        if role:
+            for member in role.members:
+                staff[member.id] = member
+    return list(staff.values())
+
+
+class RoleQueue:
+    """
+    Serializes Discord role edits through a single worker.
+    Member role edits share a tight per-guild rate limit, so requests are spaced out
+    and a duplicate of an edit that is already queued reuses the pending result.
+    """
+
+    def __init__(self, delay: float = 1.1):
+        self.delay = delay
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._pending: dict[tuple, asyncio.Future] = {}
+        self._worker: Optional[asyncio.Task] = None
+
+    def submit(self, member: discord.Member, role: discord.Role, action: str, reason: Optional[str] = None) -> asyncio.Future:
+        """Queue a role edit ('add' or 'remove'). Returns a future resolved once Discord has applied it."""
+        key = (member.guild.id, member.id, role.id, action)
+        if key in self._pending:
+            return self._pending[key]
+        
+        future = asyncio.get_running_loop().create_future()
+        if (discord.utils.get(member.roles, id=role.id) is not None) == (action == 'add'):
+            # Member is already in the requested state
+            future.set_result(None)
+            return future
+        
+        self._pending[key] = future
+        self._queue.put_nowait((key, member, role, action, reason))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(), name="role-queue")
+        return future
+
+    async def _run(self) -> None:
+        while not self._queue.empty():
+            key, member, role, action, reason = await self._queue.get()
+            future = self._pending.pop(key)
+            try:
+                if action == 'add':
+                    await member.add_roles(role, reason=reason)
+                else:
+                    await member.remove_roles(role, reason=reason)
+                future.set_result(None)
+            except Exception as e:
+                future.set_exception(e)
+            await asyncio.sleep(self.delay)
+
+
+role_queue = RoleQueue()
 
 
 async def check_role_manageable(
@@ -65,7 +149,7 @@ async def manage_discord_role(
     Handles all permission checks and error responses.
     """
     guild = interaction.guild
-    role = discord.utils.get(guild.roles, name=role_name)
+    role = get_role_by_name(guild, role_name)
     
     # Check if role exists
     if not role:
@@ -110,32 +194,34 @@ async def manage_discord_role(
         await interaction.response.send_message(error, ephemeral=True)
         return
     
-    # Perform the action
+    # Perform the action (queued; may wait behind other role edits)
+    await interaction.response.defer()
     try:
         if action == 'add':
-            await user.add_roles(role, reason=f"Assigned by {interaction.user.name}")
-            await interaction.response.send_message(
+            await role_queue.submit(user, role, 'add', reason=f"Assigned by {interaction.user.name}")
+            await interaction.followup.send(
                 f"✅ Assigned {role_name} role to {user.mention}!"
             )
         else:
-            await user.remove_roles(role, reason=f"Removed by {interaction.user.name}")
-            await interaction.response.send_message(
+            await role_queue.submit(user, role, 'remove', reason=f"Removed by {interaction.user.name}")
+            await interaction.followup.send(
                 f"✅ Removed {role_name} role from {user.mention}!"
             )
     except discord.Forbidden:
-        await interaction.response.send_message(
-            f"❌ I don't have permission to {'assign' if action == 'add' else 'remove'} this role!",
-            ephemeral=True
+        await interaction.followup.send(
+            f"❌ I don't have permission to {'assign' if action == 'add' else 'remove'} this role!"
         )
     except Exception as e:
-        await interaction.response.send_message(
-            f"❌ Error {'assigning' if action == 'add' else 'removing'} role: {e}",
-            ephemeral=True
+        await interaction.followup.send(
+            f"❌ Error {'assigning' if action == 'add' else 'removing'} role: {e}"
         )
 
 
-def gm_only(error_message: str = "❌ Only users with GM or IM role can use this command."):
-    """Decorator that restricts a command to GM/IM only."""
+GM_ONLY_MESSAGE = "❌ Only users with GM or IM role can use this command."
+
+
+def _gm_check(error_message: str):
+    """Build the app_commands check behind gm_only."""
     async def predicate(interaction: discord.Interaction) -> bool:
         if not is_gm_or_im(interaction):
             await interaction.response.send_message(error_message, ephemeral=True)
@@ -144,6 +230,17 @@ def gm_only(error_message: str = "❌ Only users with GM or IM role can use this
     return app_commands.check(predicate)
 
 
+# Shared by every command using the default message
+_default_gm_check = _gm_check(GM_ONLY_MESSAGE)
+
+
+def gm_only(error_message: str = GM_ONLY_MESSAGE):
+    """Decorator that restricts a command to GM/IM only."""
+    if error_message == GM_ONLY_MESSAGE:
+        return _default_gm_check
+    return _gm_check(error_message)
+
+
 def require_game(status: Optional[str] = None):
     """
     Decorator that requires an active game.
@@ -3,9 +3,9 @@ Role action processing for SEBOT.
 Handles night action resolution, day action effects, and vote modifications.
 """
 
-import random
 from typing import Optional
 from data.roles import ROLE_DEFINITIONS, RESOLUTION_ORDER
+from helpers.game_state import Phase, VOTE_NONE, KILL_NONE
 
 
 async def process_night_actions(guild, game) -> dict:
@@ -24,7 +24,10 @@ async def process_night_actions(guild, game) -> dict:
         'deaths': [],
     }
     
+    # Hoisted lookups used throughout resolution
     night_actions = game.night_actions.get(game.day_number, {})
+    players = game.players
+    day_number = game.day_number
     
     # Collect all kill targets
     kill_targets = {}  # {target_id: [killer_ids]}
@@ -32,7 +35,7 @@ async def process_night_actions(guild, game) -> dict:
     # Elim kill
     elim_kills = night_actions.get('elim_kill', [])
     for actor_id, target_id, _ in elim_kills:
-        if target_id and target_id != 'kill_none':
+        if target_id and target_id != KILL_NONE:
             if target_id not in kill_targets:
                 kill_targets[target_id] = []
             kill_targets[target_id].append(('elim', actor_id))
@@ -41,7 +44,7 @@ async def process_night_actions(guild, game) -> dict:
     coinshot_kills = night_actions.get('kill', [])
     coinshots_used = set()  # Track which coinshots have submitted (for ammo tracking)
     for actor_id, target_id, _ in coinshot_kills:
-        if target_id and target_id != 'kill_none':
+        if target_id and target_id != KILL_NONE:
             if target_id not in kill_targets:
                 kill_targets[target_id] = []
             kill_targets[target_id].append(('coinshot', actor_id))
@@ -64,8 +67,9 @@ async def process_night_actions(guild, game) -> dict:
             protections[target_id].append(actor_id)
     
     # Process each kill target
+    thug_mode = game.roles.thug_mode
     for target_id, killers in kill_targets.items():
-        player = game.players.get(target_id)
+        player = players.get(target_id)
         if not player or not player.is_alive:
             continue
         
@@ -95,23 +99,23 @@ async def process_night_actions(guild, game) -> dict:
             game.thug_used.add(target_id)
             results['saves'].append(target_id)
             
-            if game.roles.thug_mode == 'survive':
+            if thug_mode == 'survive':
                 game.add_action_result(
                     target_id,
                     "💪 You were attacked but your Thug ability saved you! (One-time use expended)"
                 )
                 continue
-            elif game.roles.thug_mode == 'delayed_phase':
+            elif thug_mode == 'delayed_phase':
                 # Attacked during Night X -> survive Day X+1 -> die at Night X+1 start
-                game.delayed_deaths.append((target_id, game.day_number + 1, 'night'))
+                game.add_delayed_death(target_id, day_number + 1, Phase.NIGHT)
                 game.add_action_result(
                     target_id,
                     "💪 You were attacked! Your Thug ability lets you survive one more phase before death."
                 )
                 continue
-            elif game.roles.thug_mode == 'delayed_cycle':
+            elif thug_mode == 'delayed_cycle':
                 # Attacked during Night X -> survive Day X+1, Night X+1 -> die at Day X+2 start
-                game.delayed_deaths.append((target_id, game.day_number + 2, 'day'))
+                game.add_delayed_death(target_id, day_number + 2, Phase.DAY)
                 game.add_action_result(
                     target_id,
                     "💪 You were attacked! Your Thug ability lets you survive one more full cycle before death."
@@ -126,12 +130,13 @@ async def process_night_actions(guild, game) -> dict:
     
     # Process Seeker investigations
     seek_actions = night_actions.get('investigate', [])
+    seeker_mode = game.roles.seeker_mode
     for actor_id, target_id, _ in seek_actions:
         if not target_id:
             continue
         
-        target_player = game.players.get(target_id)
-        seeker = game.players.get(actor_id)
+        target_player = players.get(target_id)
+        seeker = players.get(actor_id)
         
         if not target_player or not seeker or not seeker.is_alive:
             continue
@@ -147,12 +152,12 @@ async def process_night_actions(guild, game) -> dict:
         # Build result based on seeker_mode
         target_name = game.get_player_display_name(target_id)
         
-        if game.roles.seeker_mode == 'role_only':
+        if seeker_mode == 'role_only':
             game.add_action_result(
                 actor_id,
                 f"🔍 **{target_name}** has the role: **{target_player.role or 'Vanilla'}**"
             )
-        elif game.roles.seeker_mode == 'alignment_only':
+        elif seeker_mode == 'alignment_only':
             faction = game.get_faction_name(target_player.alignment)
             game.add_action_result(
                 actor_id,
@@ -289,19 +294,15 @@ def format_vote_count_with_modifications(game) -> str:
     raw_votes = game.get_day_votes()
     effective_votes = calculate_effective_votes(game, add_results=False)
     
-    # Group raw votes by target
-    raw_vote_groups = {}
-    for voter_id, target_id in raw_votes.items():
-        if target_id not in raw_vote_groups:
-            raw_vote_groups[target_id] = []
-        raw_vote_groups[target_id].append(voter_id)
+    # Raw votes grouped by target
+    raw_vote_groups = game.tally_votes()
     
     # Find all targets (union of raw and effective)
     all_targets = set(raw_vote_groups.keys()) | set(effective_votes.keys())
     
     # Find players who didn't vote
-    alive_players = [uid for uid, p in game.players.items() if p.is_alive]
-    abstainers = [uid for uid in alive_players if uid not in raw_votes]
+    alive_ids = game.alive_ids
+    abstainers = [uid for uid in game.players if uid in alive_ids and uid not in raw_votes]
     
     lines = ["📊 **Final Vote Count**"]
     
@@ -320,14 +321,14 @@ def format_vote_count_with_modifications(game) -> str:
             continue
         
         # Get target name
-        if target_id == 'vote_none':
+        if target_id == VOTE_NONE:
             target_name = "No Elimination"
         else:
             target_name = game.get_player_display_name(target_id)
         
         # Get raw voter names (only those who publicly voted for this target)
         raw_voters = raw_vote_groups.get(target_id, [])
-        voter_names = [game.get_player_display_name(vid) for vid in raw_voters]
+        voter_names = game.get_player_display_names(raw_voters)
         
         # Show effective count with raw voter names
         # If no raw voters (vote came from Riot), names list will be empty
@@ -339,7 +340,7 @@ def format_vote_count_with_modifications(game) -> str:
     
     # Add abstainers
     if abstainers:
-        abstainer_names = [game.get_player_display_name(uid) for uid in abstainers]
+        abstainer_names = game.get_player_display_names(abstainers)
         lines.append(f"**No Vote** ({len(abstainers)}): {', '.join(abstainer_names)}")
     
     return "\n".join(lines)
@@ -367,7 +368,7 @@ def assign_mistborn_power(game, player_id: int) -> Optional[str]:
         return None
     
     # Pick random power
-    power = random.choice(available)
+    power = game.rng.choice(available)
     
     # Record usage
     if player_id not in game.mistborn_powers_used:
@@ -456,12 +457,11 @@ def can_use_role_action(game, player_id: int, action_type: str) -> tuple[bool, s
     
     # Check phase requirements
     required_phase = role_info.get('action_phase')
-    current_phase = 'Day' if 'Day' in game.phase else 'Night'
     
-    if required_phase == 'night' and current_phase != 'Night':
+    if required_phase == 'night' and not game.is_night():
         return False, "This action can only be used at night."
     
-    if required_phase == 'day' and current_phase != 'Day':
+    if required_phase == 'day' and not game.is_day():
         return False, "This action can only be used during the day."
     
     # Check Lurcher consecutive target restriction
@@ -1,26 +1,24 @@
 """Utility helper functions."""
 
+import asyncio
 import discord
-from datetime import datetime
-from typing import Optional
+from typing import Awaitable, Iterable, Optional
 
 from helpers.game_state import Game
-from helpers.permissions import get_gm_role, get_im_role
+from helpers.permissions import get_gm_role, get_im_role, get_staff_members
 
 
-def format_time_remaining(end_time: Optional[datetime]) -> str:
-    """Format remaining time in a readable way."""
-    if not end_time:
+def format_time_remaining(game: Game) -> str:
+    """Format remaining time in the game's current phase in a readable way."""
+    remaining = game.seconds_remaining()
+    if remaining is None:
         return "No timer set"
     
-    now = datetime.now()
-    remaining = end_time - now
-    
-    if remaining.total_seconds() <= 0:
+    if remaining <= 0:
         return "Phase has ended!"
     
-    hours = int(remaining.total_seconds() // 3600)
-    minutes = int((remaining.total_seconds() % 3600) // 60)
+    hours = int(remaining // 3600)
+    minutes = int((remaining % 3600) // 60)
     
     if hours > 0:
         return f"{hours}h {minutes}m remaining"
@@ -28,9 +26,16 @@ def format_time_remaining(end_time: Optional[datetime]) -> str:
         return f"{minutes}m remaining"
 
 
-async def update_game_channel_permissions(guild: discord.Guild, game: Game) -> None:
-    """Update game channel permissions based on living players and game mode."""
-    game_channel = guild.get_channel(game.channels.game_channel_id)
+async def update_game_channel_permissions(
+    guild: discord.Guild,
+    game: Game,
+    game_channel: Optional[discord.TextChannel] = None
+) -> None:
+    """
+    Update game channel permissions based on living players and game mode.
+    Pass game_channel if the caller has already resolved it.
+    """
+    game_channel = game_channel or guild.get_channel(game.channels.game_channel_id)
     if not game_channel:
         return
     
@@ -75,7 +80,14 @@ async def update_game_channel_permissions(guild: discord.Guild, game: Game) -> N
                     create_private_threads=False
                 )
     
+    # Each target type always gets the same overwrite, so the target set identifies the
+    # whole overwrite map - skip the rate-limited edit if nothing changed since last time
+    permissions_key = (game_channel.id, frozenset(target.id for target in overwrites))
+    if permissions_key == game.channels.permissions_key:
+        return
+    
     await game_channel.edit(overwrites=overwrites)
+    game.channels.permissions_key = permissions_key
 
 
 async def add_user_to_thread_safe(thread: discord.Thread, member: discord.Member) -> bool:
@@ -88,6 +100,110 @@ async def add_user_to_thread_safe(thread: discord.Thread, member: discord.Member
         return False
 
 
+# Discord rejects messages over 2000 characters; leave headroom for markdown
+MESSAGE_CHUNK_LIMIT = 1800
+
+
+def split_message(text: str, limit: int = MESSAGE_CHUNK_LIMIT) -> list[str]:
+    """
+    Split text into chunks of at most `limit` characters, breaking between lines.
+    A single line longer than `limit` is split mid-line.
+    """
+    chunks = []
+    current = ""
+    
+    for line in text.split("\n"):
+        while len(line) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:limit])
+            line = line[limit:]
+        
+        candidate = f"{current}\n{line}" if current else line
+        if len(candidate) > limit:
+            chunks.append(current)
+            current = line
+        else:
+            current = candidate
+    
+    if current:
+        chunks.append(current)
+    
+    # Drop blank lines left at chunk boundaries
+    return [chunk.strip("\n") for chunk in chunks if chunk.strip()]
+
+
+# Max Discord requests in flight per batch (keeps bursts under the global rate limit)
+DISCORD_CONCURRENCY = 5
+
+
+async def gather_limited(
+    coros: Iterable[Awaitable],
+    limit: int = DISCORD_CONCURRENCY,
+    return_exceptions: bool = False
+) -> list:
+    """
+    Await coroutines concurrently, at most `limit` at a time. Results keep input order.
+    With return_exceptions, a failing coroutine's exception is returned in its slot instead of raised.
+    """
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def run(coro):
+        async with semaphore:
+            return await coro
+    
+    return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=return_exceptions)
+
+
+async def add_users_to_threads(additions: Iterable[tuple[discord.Thread, discord.Member]]) -> int:
+    """Add (thread, member) pairs concurrently. Returns count of successful adds."""
+    results = await gather_limited(
+        add_user_to_thread_safe(thread, member) for thread, member in additions
+    )
+    return sum(results)
+
+
+# Strong references to fire-and-forget tasks so they aren't garbage-collected mid-run
+_background_tasks: set[asyncio.Task] = set()
+
+
+def run_in_background(coro: Awaitable, name: Optional[str] = None) -> asyncio.Task:
+    """
+    Schedule a coroutine without awaiting it (e.g. follow-up work after an interaction reply).
+    Exceptions are logged instead of being silently dropped.
+    """
+    task = asyncio.create_task(coro, name=name)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+    return task
+
+
+def _on_background_task_done(task: asyncio.Task) -> None:
+    """Release a finished background task and log any error it raised."""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        print(f"Error in background task {task.get_name()}: {task.exception()}")
+
+
+async def create_private_thread(channel: discord.TextChannel, name: str) -> discord.Thread:
+    """Create a private, non-invitable thread under a channel."""
+    return await channel.create_thread(
+        name=name,
+        type=discord.ChannelType.private_thread,
+        invitable=False
+    )
+
+
+async def create_private_thread_safe(channel: discord.TextChannel, name: str) -> Optional[discord.Thread]:
+    """Create a private thread, returning None (and logging) if Discord rejects it."""
+    try:
+        return await create_private_thread(channel, name)
+    except discord.HTTPException as e:
+        print(f"Error creating thread {name} in {channel.name}: {e}")
+        return None
+
+
 async def close_all_pm_threads(guild: discord.Guild, game: 'Game') -> int:
     """
     Close (lock and archive) all PM threads.
@@ -108,6 +224,26 @@ async def close_all_pm_threads(guild: discord.Guild, game: 'Game') -> int:
     return closed_count
 
 
+async def close_pms_if_disabled(
+    guild: discord.Guild,
+    game: 'Game',
+    game_channel: Optional[discord.TextChannel],
+    pms_were_open: bool
+) -> None:
+    """
+    Close all PM threads if game.pms_open flipped from open to closed since pms_were_open was read.
+    Game.eliminate_player() re-checks availability when a PM-enabling role dies.
+    """
+    if not pms_were_open or game.pms_open:
+        return
+    
+    closed_count = await close_all_pm_threads(guild, game)
+    if closed_count > 0 and game_channel:
+        await game_channel.send(
+            f"🔒 **PMs have been disabled!** {closed_count} PM thread(s) have been closed."
+        )
+
+
 async def create_pm_thread(
     guild: discord.Guild,
     game: 'Game',
@@ -118,8 +254,6 @@ async def create_pm_thread(
     Create a PM thread between two players.
     Returns the thread or None if creation failed.
     """
-    from helpers.permissions import get_gm_role, get_im_role
-    
     game_channel = guild.get_channel(game.channels.game_channel_id)
     if not game_channel:
         return None
@@ -142,30 +276,16 @@ async def create_pm_thread(
     thread_name = f"💬-{thread_prefix}-{name1[:10]}-{name2[:10]}"
     
     try:
-        pm_thread = await game_channel.create_thread(
-            name=thread_name,
-            type=discord.ChannelType.private_thread,
-            invitable=False
-        )
+        pm_thread = await create_private_thread(game_channel, thread_name)
         
         # Add both players
-        member1 = guild.get_member(player1_id)
-        member2 = guild.get_member(player2_id)
-        
-        if member1:
-            await add_user_to_thread_safe(pm_thread, member1)
-        if member2:
-            await add_user_to_thread_safe(pm_thread, member2)
+        members = [guild.get_member(player1_id), guild.get_member(player2_id)]
         
         # Add GMs/IMs if configured
         if game.config.gms_see_pms:
-            gm_role = get_gm_role(guild)
-            im_role = get_im_role(guild)
-            
-            for role in [gm_role, im_role]:
-                if role:
-                    for member in role.members:
-                        await add_user_to_thread_safe(pm_thread, member)
+            members.extend(get_staff_members(guild))
+        
+        await add_users_to_threads((pm_thread, member) for member in members if member)
         
         # Store thread reference
         key = game.get_pm_thread_key(player1_id, player2_id)
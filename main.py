@@ -3,6 +3,8 @@ SEBOT - 17th Shard Elimination Game Bot
 Main entry point and message routing.
 """
 
+import aiohttp
+import asyncio
 import discord
 from discord.ext import commands
 import os
@@ -75,19 +77,19 @@ async def on_message(message):
     if message.author.bot:
         return
     
-    # Check spectator restrictions
-    for guild_id, game in games.items():
-        if game.status == 'active' and message.author.id in game.spectators:
-            if message.channel.id != game.channels.dead_spec_thread_id:
-                try:
-                    await message.delete()
-                    await message.author.send(
-                        "⚠️ As a spectator, you can only post in the dead/spectator thread. "
-                        "Your message was deleted."
-                    )
-                except:
-                    pass
-                return
+    # Check spectator restrictions (only this server's game can apply)
+    game = games.get(message.guild.id) if message.guild else None
+    if game and game.status == 'active' and message.author.id in game.spectators:
+        if message.channel.id != game.channels.dead_spec_thread_id:
+            try:
+                await message.delete()
+                await message.author.send(
+                    "⚠️ As a spectator, you can only post in the dead/spectator thread. "
+                    "Your message was deleted."
+                )
+            except:
+                pass
+            return
     
     # Route text commands
     content = message.content.lower()
@@ -135,5 +137,18 @@ async def on_message(message):
 
 # ===== RUN =====
 
+async def main():
+    """Start the bot on a keep-alive HTTP connector shared by all REST calls."""
+    discord.utils.setup_logging()
+    # Created inside the running loop; limit=0 keeps discord.py's unbounded pool,
+    # the longer keepalive lets bursts (thread creation in start_game) reuse connections
+    bot.http.connector = aiohttp.TCPConnector(limit=0, keepalive_timeout=75)
+    async with bot:
+        await bot.start(TOKEN)
+
+
 if __name__ == "__main__":
-    bot.run(TOKEN)
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
\ No newline at end of file
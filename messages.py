@@ -22,6 +22,7 @@ class Errors:
     # Phase errors
     NIGHT_ONLY = "❌ You can only use this ability at night!"
     DAY_ONLY = "❌ You can only use this ability during the day!"
+    PHASE_ALREADY_ENDING = "⚠️ The phase is already being ended!"
     
     # Target errors
     NO_SELF_TARGET = "❌ You cannot target yourself!"
@@ -179,6 +180,12 @@ class Info:
 class Announcements:
     """Public game announcements."""
     
+    # Phase transition templates (fill with .format)
+    DAY_END = "☀️ **Day {day} has ended.**"
+    DAY_BEGINS = "☀️ **Day {day} begins!**"
+    VOTING_OPEN = "Discussion and voting are now open."
+    GAME_OVER = "🎊 **GAME OVER!**\n{result}\n\nArchiving game channels..."
+    
     @staticmethod
     def player_killed(name: str, alignment: str, role: str) -> str:
         return (
@@ -214,10 +221,10 @@ class Announcements:
     
     @staticmethod
     def day_start(day_num: int, kill_msg: str, tineye_msg: str = None) -> str:
-        announcement = f"☀️ **Day {day_num} begins!**\n\n{kill_msg}"
+        announcement = f"{Announcements.DAY_BEGINS.format(day=day_num)}\n\n{kill_msg}"
         if tineye_msg:
             announcement += f"\n{tineye_msg}"
-        announcement += "\n\nDiscussion and voting are now open."
+        announcement += f"\n\n{Announcements.VOTING_OPEN}"
         return announcement
     
     @staticmethod
@@ -225,6 +232,101 @@ class Announcements:
         return f"🌙 **Night {day_num} begins...**"
 
 
+# ===== HELP TEXT =====
+
+class Help:
+    """Static blocks of the /commands help lists; handlers add the game-dependent lines."""
+    
+    OVERVIEW = """**📚 SEBOT Command Categories**
+
+Use these commands to see detailed command lists:
+
+• `/player_commands` - Gameplay commands (voting, actions, etc.)
+• `/pregame_commands` - Pre-game commands (join, leave, roles)"""
+    
+    OVERVIEW_GM = "\n• `/gm_commands` - GM/IM setup and management commands"
+    
+    OVERVIEW_UTILITY = """
+
+**🔧 Utility:**
+• `/ping` - Test if bot is responding
+• `/test` - Test your permissions"""
+    
+    GM_COMMANDS = """**🎮 GM/IM Setup Commands**
+
+**Game Creation:**
+• `/create_game` - Create a new game
+• `/set_game_name` - Set game tag and flavor name
+• `/create_game_channel` - Create game discussion channel
+• `/set_game_channel` - Use existing channel as game channel
+
+**Configuration:**
+• `/config_game` - Configure game settings (timing, win condition, anon mode, faction names, role settings)
+• `/set_pm_roles` - Set which roles enable PMs
+
+**Role Management:**
+• `/assign_gm` / `/assign_im` - Give GM/IM roles
+• `/remove_gm` / `/remove_im` - Remove GM/IM roles
+
+**Player Setup:**
+• `/assign_role` - Assign alignment and role to a player
+• `/randomize_alignments` - Randomly assign village/elim alignments
+• `/assign_identities` - Randomly assign anonymous identities
+• `/assign_identity` - Manually assign specific anonymous identity
+• `/remove_player` - Remove a player (before game starts)
+
+**Game Control:**
+• `/start_game` - Start the game
+• `/end_phase` - Manually end current phase
+• `/end_game` - End and archive the game
+
+**Moderation:**
+• `/clear_votes` - Clear all votes for current day
+• `/force_kill` - Force eliminate a player
+• `/revive` - Revive an eliminated player
+• `/player_list` - View all players with alignments/roles (GM view)"""
+    
+    PREGAME_COMMANDS = """**📋 Pre-Game Commands**
+
+**Joining:**
+• `/join_game` - Join the current game
+• `/leave_game` - Leave before game starts
+• `/spectate_game` - Spectate the active game
+
+**Information:**
+• `/player_list` - View all players
+• `/roles` - View available roles for this game mode"""
+    
+    PLAYER_COMMANDS = """**👤 Player Gameplay Commands**
+
+**Slash Commands:**
+• `/vote_count` - See current vote tallies
+• `/all_vote_counts` - See all vote results from this game
+• `/time_remaining` - Check phase time
+• `/player_list` - View all players
+
+**Voting (in game channel"""
+    
+    PLAYER_TEXT_COMMANDS = """
+• `!unvote` - Remove your current vote
+
+**Text Commands (use in your GM-PM thread):**
+• `!actions` - View your role's abilities and commands"""
+    
+    PLAYER_ROLE_ACTIONS = """
+
+**⚔️ Role Action Commands (use in GM-PM thread):**
+• `!coinshot [player]` / `!cs [player]` - Coinshot kill (night)
+• `!lurcher [player]` / `!lurch [player]` - Lurcher protect (night)
+• `!seek [player]` - Seeker investigate (night)
+• `!riot [player] to [target]` - Rioter redirect vote (day)
+• `!soothe [player]` - Soother cancel vote (day)
+• `!smoke [player]` / `!smoke+` / `!smoke-` - Smoker protection
+• `!tin [message]` / `!tinpost [message]` - Tineye anonymous message
+
+*Use `!actions` in your GM-PM thread to see only YOUR role's commands.*"""
+
+
 # ===== ACTION RESULTS (Private) =====
 
 class ActionResults: